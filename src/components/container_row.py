@@ -0,0 +1,76 @@
+from typing import Any
+
+from gi.repository import Adw, GObject, Gtk
+
+from ..utils.icons import get_icon_paintable
+
+NEXT_ACTION_ICONS = {
+    "start": "play.svg",
+    "stop": "circle-crossed.svg",
+}
+
+
+def get_badge_classes(style_class: str | None) -> list[str]:
+    return ["tag", "caption", style_class] if style_class else ["tag", "caption"]
+
+
+@Gtk.Template(resource_path="/com/scrlkx/dockery/components/container_row.ui")
+class ContainerRow(Adw.ActionRow):
+    __gtype_name__ = "ContainerRow"
+
+    __gsignals__ = {"next-action": (GObject.SignalFlags.RUN_FIRST, None, (str,))}
+
+    name = GObject.Property(type=str)
+    image = GObject.Property(type=str)
+    status_label = GObject.Property(type=str)
+    health_label = GObject.Property(type=str)
+    next_action = GObject.Property(type=str)
+    flapping = GObject.Property(type=bool, default=False)
+
+    image_badge = Gtk.Template.Child()
+    status_badge = Gtk.Template.Child()
+    health_badge = Gtk.Template.Child()
+    action_button = Gtk.Template.Child()
+    action_image = Gtk.Template.Child()
+    chevron = Gtk.Template.Child()
+
+    scale: int
+
+    def __init__(self, scale: int = 1, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+
+        self.scale = scale
+        self.chevron.set_from_paintable(get_icon_paintable("chevron-right.svg", scale))
+
+    def set_image(self, image: str | None) -> None:
+        self.image = image or ""
+        self.image_badge.set_visible(bool(image))
+
+    def set_status(self, label: str | None, style_class: str | None) -> None:
+        self.status_label = label or ""
+        self._update_badge(self.status_badge, label, style_class)
+
+    def set_health(self, label: str | None, style_class: str | None) -> None:
+        self.health_label = label or ""
+        self._update_badge(self.health_badge, label, style_class)
+
+    def _update_badge(
+        self, badge: Gtk.Label, label: str | None, style_class: str | None
+    ) -> None:
+        badge.set_css_classes(get_badge_classes(style_class))
+        badge.set_visible(bool(label and style_class))
+
+    def set_next_action(self, next_action: str) -> None:
+        self.next_action = next_action
+        icon_name = NEXT_ACTION_ICONS.get(next_action)
+
+        if icon_name:
+            self.action_image.set_from_paintable(
+                get_icon_paintable(icon_name, self.scale)
+            )
+
+        self.action_button.set_visible(icon_name is not None)
+
+    @Gtk.Template.Callback()
+    def on_action_clicked(self, _: Gtk.Button) -> None:
+        self.emit("next-action", self.next_action)
@@ -0,0 +1,92 @@
+import socket
+
+from docker.errors import DockerException
+from gi.repository import GLib, GObject, Vte
+
+from ..utils.exec_session import ExecSession, create_exec
+from ..utils.threads import run_in_background
+
+# resizes are sent once the allocation settles instead of on every frame
+RESIZE_DELAY_MS = 100
+
+
+class ExecTerminal(Vte.Terminal):
+    __gtype_name__ = "ExecTerminal"
+
+    __gsignals__ = {"exited": (GObject.SignalFlags.RUN_FIRST, None, (int,))}
+
+    session: ExecSession | None = None
+    size: tuple[int, int] = (0, 0)
+    resize_source_id: int = 0
+    closed: bool = False
+
+    def attach(self, container_id: str) -> None:
+        def _create() -> tuple[str, socket.socket] | str:
+            try:
+                return create_exec(container_id)
+            except DockerException as error:
+                return str(error)
+
+        run_in_background(
+            _create,
+            self._on_created,
+            "docker_exec_create",
+            lambda error: self._on_created(str(error)),
+        )
+
+    def _on_created(self, result: tuple[str, socket.socket] | str) -> None:
+        if isinstance(result, str):
+            self.feed(f"{result}\r\n".encode())
+            self.set_input_enabled(False)
+            return
+
+        exec_id, sock = result
+
+        if self.closed:
+            sock.close()
+            return
+
+        self.session = ExecSession(exec_id, sock, self.feed, self._on_exit)
+        self._queue_resize()
+
+    def _on_exit(self, exit_code: int | None) -> None:
+        self.session = None
+        self.set_input_enabled(False)
+
+        self.emit("exited", -1 if exit_code is None else exit_code)
+
+    def do_size_allocate(self, width: int, height: int, baseline: int) -> None:
+        Vte.Terminal.do_size_allocate(self, width, height, baseline)
+
+        self._queue_resize()
+
+    def _queue_resize(self) -> None:
+        if not self.resize_source_id:
+            self.resize_source_id = GLib.timeout_add(RESIZE_DELAY_MS, self._resize)
+
+    def _resize(self) -> bool:
+        self.resize_source_id = 0
+
+        size = (self.get_column_count(), self.get_row_count())
+
+        if self.session is not None and size != self.size:
+            self.size = size
+            self.session.resize(*size)
+
+        return False
+
+    def do_commit(self, text: str, size: int) -> None:
+        # size is the length of text in bytes, empty commits carry nothing
+        if self.session is not None and size:
+            self.session.write(text.encode())
+
+    def close(self) -> None:
+        self.closed = True
+
+        if self.resize_source_id:
+            GLib.source_remove(self.resize_source_id)
+            self.resize_source_id = 0
+
+        if self.session is not None:
+            self.session.close()
+            self.session = None
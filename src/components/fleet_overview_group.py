@@ -0,0 +1,168 @@
+from typing import Any
+
+from gi.repository import Adw, GLib, GObject, Gtk
+
+from ..utils.fleet import FACETS, FacetValue, FleetOverview
+from ..utils.sorting import ContainerItem
+
+
+def get_reserved_label(cpus: int, memory: int) -> str:
+    if not cpus and not memory:
+        return "No reservations"
+
+    parts: list[str] = []
+
+    if cpus:
+        parts.append(f"{cpus / 1_000_000_000:g} CPUs")
+
+    if memory:
+        parts.append(GLib.format_size(memory))
+
+    return f"{' · '.join(parts)} reserved"
+
+
+class FleetOverviewGroup(Adw.PreferencesGroup):
+    __gtype_name__ = "FleetOverviewGroup"
+
+    __gsignals__ = {"facet-changed": (GObject.SignalFlags.RUN_FIRST, None, ())}
+
+    overview: FleetOverview
+    active_facet: FacetValue | None
+    reserved_label: Gtk.Label
+    sections: dict[str, Gtk.Box]
+    flow_boxes: dict[str, Gtk.FlowBox]
+    buttons: dict[FacetValue, Gtk.ToggleButton]
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+
+        self.overview = FleetOverview()
+        self.active_facet = None
+        self.sections = {}
+        self.flow_boxes = {}
+        self.buttons = {}
+
+        self.set_title("Overview")
+
+        self.reserved_label = Gtk.Label(valign=Gtk.Align.CENTER)
+        self.reserved_label.add_css_class("dim-label")
+        self.reserved_label.add_css_class("caption")
+        self.set_header_suffix(self.reserved_label)
+
+        for facet in FACETS:
+            self.add_section(facet["key"], facet["title"])
+
+    def add_section(self, key: str, title: str) -> None:
+        section = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL, spacing=6, visible=False
+        )
+
+        label = Gtk.Label(label=title, xalign=0)
+        label.add_css_class("caption-heading")
+
+        flow_box = Gtk.FlowBox(
+            selection_mode=Gtk.SelectionMode.NONE,
+            max_children_per_line=20,
+            column_spacing=6,
+            row_spacing=6,
+        )
+
+        section.append(label)
+        section.append(flow_box)
+
+        self.add(section)
+        self.sections[key] = section
+        self.flow_boxes[key] = flow_box
+
+    def reset(self, items: list[ContainerItem]) -> None:
+        self.overview.reset(items)
+
+        for facet in list(self.buttons):
+            self.remove_button(facet)
+
+        for facet in self.overview.members:
+            self.refresh_button(facet)
+
+        self.refresh_summary()
+
+        if self.active_facet and self.active_facet not in self.buttons:
+            self.set_active_facet(None)
+
+    def update(self, container_id: str, item: ContainerItem | None) -> None:
+        # only the chips whose counts moved are touched
+        for facet in self.overview.update(container_id, item):
+            self.refresh_button(facet)
+
+        self.refresh_summary()
+
+    def refresh_summary(self) -> None:
+        self.set_visible(bool(self.overview.entries))
+        self.reserved_label.set_text(
+            get_reserved_label(self.overview.cpus, self.overview.memory)
+        )
+
+        for key, section in self.sections.items():
+            section.set_visible(bool(self.flow_boxes[key].get_first_child()))
+
+    def refresh_button(self, facet: FacetValue) -> None:
+        count = self.overview.get_count(facet)
+        button = self.buttons.get(facet)
+
+        if not count:
+            self.remove_button(facet)
+
+            if facet == self.active_facet:
+                self.set_active_facet(None)
+
+            return
+
+        if button is None:
+            button = self.add_button(facet)
+
+        button.set_label(f"{facet[1]}: {count}")
+
+    def add_button(self, facet: FacetValue) -> Gtk.ToggleButton:
+        key, value = facet
+
+        button = Gtk.ToggleButton(active=facet == self.active_facet)
+        button.add_css_class("tag")
+        button.add_css_class("caption")
+        button.add_css_class("facet")
+        button.connect("toggled", self.on_button_toggled, facet)
+
+        # keep the chips of a section in name order
+        position = sum(
+            1 for other in self.buttons if other[0] == key and other[1] < value
+        )
+
+        self.flow_boxes[key].insert(button, position)
+        self.buttons[facet] = button
+
+        return button
+
+    def remove_button(self, facet: FacetValue) -> None:
+        button = self.buttons.pop(facet, None)
+
+        if button is not None:
+            self.flow_boxes[facet[0]].remove(button)
+
+    def set_active_facet(self, facet: FacetValue | None) -> None:
+        previous = self.active_facet
+        self.active_facet = facet
+
+        if previous in self.buttons and previous != facet:
+            self.buttons[previous].set_active(False)
+
+        self.emit("facet-changed")
+
+    def matches(self, container_id: str) -> bool:
+        if self.active_facet is None:
+            return True
+
+        return self.overview.has_container(self.active_facet, container_id)
+
+    def on_button_toggled(self, button: Gtk.ToggleButton, facet: FacetValue) -> None:
+        if button.get_active():
+            self.set_active_facet(facet)
+        elif facet == self.active_facet:
+            self.set_active_facet(None)
@@ -0,0 +1,177 @@
+from typing import Any, cast
+
+from gi.repository import Gio, GObject, Gtk, Pango
+
+# characters of a value rendered until the row is expanded
+PREVIEW_LENGTH = 120
+
+# below this many items the filter entry is just noise
+SEARCH_THRESHOLD = 10
+
+
+def get_value_preview(value: str) -> str:
+    line = value.partition("\n")[0]
+
+    if len(line) > PREVIEW_LENGTH:
+        return line[:PREVIEW_LENGTH] + "…"
+
+    return line if line == value else line + " …"
+
+
+class KeyValueItem(GObject.Object):
+    __gtype_name__ = "KeyValueItem"
+
+    key = GObject.Property(type=str)
+    value = GObject.Property(type=str)
+    search = GObject.Property(type=str)
+    expanded = GObject.Property(type=bool, default=False)
+
+    def __init__(self, key: str, value: str, expanded: bool = False) -> None:
+        super().__init__(key=key, value=value, search=f"{key}={value}")
+
+        self.expanded = expanded
+
+
+class KeyValueListRow(Gtk.Box):
+    key_label: Gtk.Label
+    value_label: Gtk.Label
+    expand_button: Gtk.Button
+    item: KeyValueItem | None
+
+    def __init__(self) -> None:
+        super().__init__(
+            orientation=Gtk.Orientation.HORIZONTAL,
+            spacing=12,
+            margin_top=8,
+            margin_bottom=8,
+            margin_start=12,
+            margin_end=12,
+        )
+
+        self.item = None
+
+        self.key_label = Gtk.Label(
+            xalign=0,
+            valign=Gtk.Align.START,
+            ellipsize=Pango.EllipsizeMode.MIDDLE,
+            max_width_chars=32,
+            selectable=True,
+        )
+
+        self.value_label = Gtk.Label(
+            xalign=1,
+            hexpand=True,
+            selectable=True,
+            wrap_mode=Pango.WrapMode.WORD_CHAR,
+        )
+        self.value_label.add_css_class("dim-label")
+
+        self.expand_button = Gtk.Button(valign=Gtk.Align.START)
+        self.expand_button.add_css_class("flat")
+        self.expand_button.connect("clicked", self.on_expand_clicked)
+
+        self.append(self.key_label)
+        self.append(self.value_label)
+        self.append(self.expand_button)
+
+    def bind(self, item: KeyValueItem) -> None:
+        self.item = item
+        self.key_label.set_text(item.key)
+        self.update()
+
+    def unbind(self) -> None:
+        self.item = None
+
+    def update(self) -> None:
+        if self.item is None:
+            return
+
+        value = self.item.value
+        preview = get_value_preview(value)
+        truncated = preview != value
+        expanded = truncated and self.item.expanded
+
+        # the full value is only laid out once the row is expanded
+        self.value_label.set_text(value if expanded else preview)
+        self.value_label.set_wrap(expanded)
+        self.value_label.set_ellipsize(
+            Pango.EllipsizeMode.NONE if expanded else Pango.EllipsizeMode.END
+        )
+
+        self.expand_button.set_visible(truncated)
+        self.expand_button.set_label("Less" if expanded else "More")
+
+    def on_expand_clicked(self, _: Gtk.Button) -> None:
+        if self.item is None:
+            return
+
+        self.item.expanded = not self.item.expanded
+        self.update()
+
+
+@Gtk.Template(resource_path="/com/scrlkx/dockery/components/key_value_list.ui")
+class KeyValueList(Gtk.Box):
+    __gtype_name__ = "KeyValueList"
+
+    search_entry = Gtk.Template.Child()
+    list_view = Gtk.Template.Child()
+
+    store: Gio.ListStore
+    filter: Gtk.StringFilter
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+
+        self.store = Gio.ListStore(item_type=KeyValueItem)
+
+        # matched in C on the item's search property, no Python per row
+        self.filter = Gtk.StringFilter(
+            expression=Gtk.PropertyExpression.new(KeyValueItem, None, "search"),
+            ignore_case=True,
+            match_mode=Gtk.StringFilterMatchMode.SUBSTRING,
+        )
+
+        model = Gtk.FilterListModel(
+            model=self.store,
+            filter=self.filter,
+            incremental=True,
+        )
+
+        # only the rows in view get widgets, recycled while scrolling
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self.on_setup)
+        factory.connect("bind", self.on_bind)
+        factory.connect("unbind", self.on_unbind)
+
+        self.list_view.set_model(Gtk.NoSelection(model=model))
+        self.list_view.set_factory(factory)
+
+    def set_items(self, items: dict[str, str]) -> None:
+        # rows the user expanded stay expanded across reloads
+        expanded = {
+            item.key
+            for item in cast(list[KeyValueItem], list(self.store))
+            if item.expanded
+        }
+
+        self.store.splice(
+            0,
+            self.store.get_n_items(),
+            [KeyValueItem(key, value, key in expanded) for key, value in items.items()],
+        )
+
+        self.search_entry.set_visible(len(items) > SEARCH_THRESHOLD)
+
+    def on_setup(self, _: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
+        list_item.set_child(KeyValueListRow())
+
+    def on_bind(self, _: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
+        row = cast(KeyValueListRow, list_item.get_child())
+        row.bind(cast(KeyValueItem, list_item.get_item()))
+
+    def on_unbind(self, _: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
+        cast(KeyValueListRow, list_item.get_child()).unbind()
+
+    @Gtk.Template.Callback()
+    def on_search_changed(self, entry: Gtk.SearchEntry) -> None:
+        self.filter.set_search(entry.get_text())
@@ -0,0 +1,231 @@
+import time
+from typing import Any, cast
+
+from docker.errors import DockerException
+from gi.repository import Adw, GLib, Gtk
+
+from ..utils.lifecycle import THROTTLED_INTERVAL_MS, Activity, get_lifecycle
+from ..utils.processes import (
+    BASE_INTERVAL_MS,
+    ProcessTable,
+    diff_processes,
+    get_next_interval,
+    get_process_table,
+)
+from ..utils.threads import run_in_background
+
+
+def get_process_details(titles: list[str], values: list[str]) -> tuple[str, str]:
+    # ps puts the command last, the other columns go in the subtitle
+    details = [f"{title} {value}" for title, value in zip(titles[:-1], values)]
+
+    return (values[-1] if values else "", " · ".join(details))
+
+
+class ProcessRow(Adw.ActionRow):
+    pid: int
+
+    def __init__(self, pid: str) -> None:
+        super().__init__(use_markup=False)
+
+        self.pid = int(pid) if pid.isdigit() else 0
+
+    def update(self, titles: list[str], values: list[str]) -> None:
+        title, subtitle = get_process_details(titles, values)
+
+        self.set_title(title)
+        self.set_subtitle(subtitle)
+
+
+# pylint: disable=too-many-instance-attributes
+class ProcessListGroup(Adw.PreferencesGroup):
+    # polls the container's process table while the group is on screen and
+    # the container runs, backing off while nothing changes
+    __gtype_name__ = "ProcessListGroup"
+
+    list_box: Gtk.ListBox
+    page: Gtk.Widget | None
+    container_id: str
+    running: bool
+    interval: int
+    source_id: int
+    polling: bool
+    closed: bool
+    titles: list[str]
+    processes: dict[str, list[str]]
+    rows: dict[str, ProcessRow]
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+
+        self.page = None
+        self.container_id = ""
+        self.running = False
+        self.interval = BASE_INTERVAL_MS
+        self.source_id = 0
+        self.polling = False
+        self.closed = False
+        self.titles = []
+        self.processes = {}
+        self.rows = {}
+
+        self.set_title("Processes")
+
+        self.list_box = Gtk.ListBox(selection_mode=Gtk.SelectionMode.NONE)
+        self.list_box.add_css_class("boxed-list")
+        self.list_box.set_sort_func(self.sort_rows)
+
+        self.add(self.list_box)
+
+        self.connect("map", self.on_mapped)
+        self.connect("unmap", self.on_unmapped)
+
+    def watch(self, page: Gtk.Widget) -> None:
+        self.page = page
+
+        get_lifecycle().watch(page, self.on_activity_changed)
+
+    def set_container(self, container_id: str, running: bool) -> None:
+        self.container_id = container_id
+        self.running = running
+
+        self.set_visible(running)
+
+        if running:
+            self.schedule(0)
+        else:
+            self.cancel()
+            self.clear()
+
+    def get_activity(self) -> Activity:
+        if self.page is None:
+            return Activity.ACTIVE
+
+        return get_lifecycle().get_activity(self.page)
+
+    def should_poll(self) -> bool:
+        return (
+            not self.closed
+            and self.running
+            and self.get_mapped()
+            and self.get_activity() != Activity.SUSPENDED
+        )
+
+    def schedule(self, delay: int) -> None:
+        # a poll in flight schedules the next one when it returns
+        if self.source_id or self.polling or not self.should_poll():
+            return
+
+        self.source_id = GLib.timeout_add(delay, self.poll)
+
+    def cancel(self) -> None:
+        if self.source_id:
+            GLib.source_remove(self.source_id)
+            self.source_id = 0
+
+    def poll(self) -> bool:
+        self.source_id = 0
+
+        if not self.should_poll():
+            return False
+
+        container_id = self.container_id
+        started_at = time.monotonic()
+
+        def _fetch() -> tuple[ProcessTable | str, int]:
+            try:
+                result: ProcessTable | str = get_process_table(container_id)
+            except DockerException as error:
+                result = str(error)
+
+            return (result, int((time.monotonic() - started_at) * 1000))
+
+        self.polling = True
+
+        run_in_background(
+            _fetch,
+            self.on_polled,
+            "docker_container_top",
+            lambda error: self.on_polled((str(error), 0)),
+        )
+
+        return False
+
+    def on_polled(self, result: tuple[ProcessTable | str, int]) -> None:
+        table, latency_ms = result
+
+        self.polling = False
+
+        if self.closed:
+            return
+
+        if isinstance(table, str):
+            # the container most likely stopped, its events will say so
+            self.set_description(table)
+            self.interval = get_next_interval(self.interval, False, latency_ms)
+        else:
+            self.set_description(None)
+            changed = self.apply(table)
+            self.interval = get_next_interval(self.interval, changed, latency_ms)
+
+        delay = self.interval
+
+        if self.get_activity() == Activity.THROTTLED:
+            delay = max(delay, THROTTLED_INTERVAL_MS)
+
+        self.schedule(delay)
+
+    def apply(self, table: ProcessTable) -> bool:
+        titles = table["titles"]
+        processes = table["processes"]
+
+        if titles != self.titles:
+            # other columns, every row has to be redrawn
+            self.clear()
+            self.titles = titles
+
+        added, changed, removed = diff_processes(self.processes, processes)
+
+        for pid in removed:
+            self.list_box.remove(self.rows.pop(pid))
+
+        for pid in added:
+            row = ProcessRow(pid)
+            row.update(titles, processes[pid])
+
+            self.list_box.append(row)
+            self.rows[pid] = row
+
+        for pid in changed:
+            self.rows[pid].update(titles, processes[pid])
+
+        self.processes = processes
+
+        return bool(added or changed or removed)
+
+    def clear(self) -> None:
+        for row in self.rows.values():
+            self.list_box.remove(row)
+
+        self.rows.clear()
+        self.processes = {}
+        self.titles = []
+
+    def sort_rows(self, first: Gtk.ListBoxRow, second: Gtk.ListBoxRow) -> int:
+        return cast(ProcessRow, first).pid - cast(ProcessRow, second).pid
+
+    def on_mapped(self, _: Gtk.Widget) -> None:
+        self.interval = BASE_INTERVAL_MS
+        self.schedule(0)
+
+    def on_unmapped(self, _: Gtk.Widget) -> None:
+        self.cancel()
+
+    def on_activity_changed(self, activity: Activity) -> None:
+        if activity == Activity.REMOVED:
+            self.closed = True
+            self.cancel()
+        elif activity == Activity.SUSPENDED:
+            self.cancel()
+        elif activity == Activity.ACTIVE and not self.source_id:
+            self.schedule(0)
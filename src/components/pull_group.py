@@ -0,0 +1,90 @@
+from typing import Any
+
+from gi.repository import Adw, GLib, GObject, Gtk
+
+from ..utils.pull import ImagePull, PullSummary
+
+
+def get_pull_details(summary: PullSummary) -> str:
+    if summary["error"]:
+        return summary["error"]
+
+    if not summary["layers"]:
+        return summary["status"]
+
+    details = [f"{summary['completed']} of {summary['layers']} layers"]
+
+    if summary["total"]:
+        downloaded = GLib.format_size(summary["downloaded"])
+        details.append(f"{downloaded} of {GLib.format_size(summary['total'])}")
+
+    return " · ".join(details)
+
+
+@Gtk.Template(resource_path="/com/scrlkx/dockery/components/pull_group.ui")
+class PullGroup(Adw.PreferencesGroup):
+    __gtype_name__ = "PullGroup"
+
+    __gsignals__ = {"finished": (GObject.SignalFlags.RUN_FIRST, None, (str,))}
+
+    reference_row = Gtk.Template.Child()
+    progress_row = Gtk.Template.Child()
+    cancel_button = Gtk.Template.Child()
+    progress_bar = Gtk.Template.Child()
+
+    image_pull: ImagePull | None
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+
+        self.image_pull = None
+
+    def set_reference(self, reference: str) -> None:
+        self.reference_row.set_text(reference)
+
+    def pull(self, reference: str) -> None:
+        if self.image_pull or not reference:
+            return
+
+        self.image_pull = ImagePull(reference, self.on_progress, self.on_done)
+
+        self.progress_row.set_visible(True)
+        self.progress_row.set_title(f"Pulling {reference}")
+        self.progress_row.set_subtitle("")
+        self.progress_bar.set_visible(True)
+        self.progress_bar.set_fraction(0)
+        self.cancel_button.set_sensitive(True)
+        self.reference_row.set_sensitive(False)
+
+        self.image_pull.start()
+
+    def on_progress(self, summary: PullSummary) -> None:
+        # only called a few times per second, however chatty the daemon is
+        if summary["layers"]:
+            self.progress_bar.set_fraction(summary["fraction"])
+        else:
+            self.progress_bar.pulse()
+
+        self.progress_row.set_subtitle(get_pull_details(summary))
+
+    def on_done(self, summary: PullSummary) -> None:
+        self.image_pull = None
+
+        if not summary["error"]:
+            self.progress_bar.set_fraction(1)
+
+        # the daemon's last status says whether a newer image was downloaded
+        self.progress_row.set_subtitle(summary["error"] or summary["status"])
+        self.cancel_button.set_sensitive(False)
+        self.reference_row.set_sensitive(True)
+
+        self.emit("finished", summary["error"])
+
+    @Gtk.Template.Callback()
+    def on_reference_applied(self, row: Adw.EntryRow) -> None:
+        self.pull(row.get_text().strip())
+
+    @Gtk.Template.Callback()
+    def on_cancel_clicked(self, _: Gtk.Button) -> None:
+        if self.image_pull:
+            self.image_pull.cancel()
@@ -0,0 +1,31 @@
+from gi.repository import Adw, GObject
+
+from ..utils.icons import new_icon_image
+from .badge import Badge
+
+
+class ResourceRow(Adw.ActionRow):
+    __gtype_name__ = "ResourceRow"
+
+    name = GObject.Property(type=str)
+
+    def __init__(self, title: str, subtitle: str = "") -> None:
+        super().__init__(title=title, subtitle=subtitle, use_markup=False)
+
+        self.name = title.lower()
+        self.set_activatable(True)
+
+    def add_badge(self, text: str, style_class: str = "") -> None:
+        badge = Badge(
+            text=text,
+            style_class=style_class,
+            margin_end=12,
+        )
+
+        self.add_suffix(badge)
+
+    def add_chevron(self) -> None:
+        info = new_icon_image("chevron-right.svg", self.get_scale_factor())
+        info.add_css_class("flat")
+
+        self.add_suffix(info)
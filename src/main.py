@@ -17,6 +17,7 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import logging
 import sys
 from typing import Any, Callable
 
@@ -24,14 +25,24 @@ import gi
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
+gi.require_version("GdkPixbuf", "2.0")
+gi.require_version("Vte", "3.91")
 
 # pylint: disable=wrong-import-position
 from gi.repository import Adw, Gio, GLib
 
+from .utils.flapping import get_flapping_detector
+from .utils.metrics import get_metrics_exporter
+from .utils.notifications import NotificationLimiter, send_crash_loop_notification
 from .window import DockeryWindow
 
+logger = logging.getLogger(__name__)
+
 
 class DockeryApplication(Adw.Application):
+    settings: Gio.Settings
+    notification_limiter: NotificationLimiter
+
     def __init__(self):
         super().__init__(
             application_id="com.scrlkx.dockery",
@@ -43,6 +54,22 @@ class DockeryApplication(Adw.Application):
         self.create_action("about", self.on_about_action)
         self.create_action("preferences", self.on_preferences_action)
 
+        self.settings = Gio.Settings(schema_id="com.scrlkx.dockery")
+        self.add_action(self.settings.create_action("crash-loop-notifications"))
+        self.add_action(self.settings.create_action("metrics-exporter"))
+
+        self.settings.connect("changed::metrics-exporter", self.on_metrics_changed)
+        self.settings.connect("changed::metrics-address", self.on_metrics_changed)
+
+        self.notification_limiter = NotificationLimiter()
+        get_flapping_detector().add_listener(self.on_container_flapping)
+
+    def do_startup(self) -> None:
+        Adw.Application.do_startup(self)
+
+        # later changes come through on_metrics_changed
+        self.update_metrics_exporter()
+
     def do_activate(self) -> None:
         win = self.props.active_window
 
@@ -51,6 +78,29 @@ class DockeryApplication(Adw.Application):
 
         win.present()
 
+    def do_shutdown(self) -> None:
+        get_metrics_exporter().stop()
+
+        Adw.Application.do_shutdown(self)
+
+    def update_metrics_exporter(self) -> None:
+        exporter = get_metrics_exporter()
+
+        if not self.settings.get_boolean("metrics-exporter"):
+            exporter.stop()
+            return
+
+        address = self.settings.get_string("metrics-address")
+
+        try:
+            exporter.start(address)
+        except (OSError, ValueError) as error:
+            logger.warning("Could not serve metrics on %s: %s", address, error)
+            self.settings.set_boolean("metrics-exporter", False)
+
+    def on_metrics_changed(self, _: Gio.Settings, __: str) -> None:
+        self.update_metrics_exporter()
+
     def on_about_action(self, _: Gio.SimpleAction, __: GLib.Variant | None) -> None:
         about = Adw.AboutDialog(
             application_name="dockery",
@@ -69,6 +119,20 @@ class DockeryApplication(Adw.Application):
     ) -> None:
         print("app.preferences action activated")
 
+    def on_container_flapping(
+        self, container_id: str, name: str, flapping: bool
+    ) -> None:
+        # called from the event reader thread
+        if flapping:
+            GLib.idle_add(self.notify_crash_loop, container_id, name)
+
+    def notify_crash_loop(self, container_id: str, name: str) -> None:
+        if not self.settings.get_boolean("crash-loop-notifications"):
+            return
+
+        if self.notification_limiter.allow(container_id):
+            send_crash_loop_notification(self, container_id, name)
+
     def create_action(
         self,
         name: str,
@@ -1,9 +1,13 @@
+import time
 from collections.abc import Callable
+from typing import Any, cast
 
 from docker.models.containers import Container
-from gi.repository import Adw, Gtk
+from gi.repository import Adw, GObject, Gtk
 
+from ..components.key_value_list import KeyValueList
 from ..components.key_value_row import KeyValueRow
+from ..components.process_list_group import ProcessListGroup
 from ..utils.docker import (
     get_container,
     get_container_actions,
@@ -11,7 +15,9 @@ from ..utils.docker import (
     get_container_created_at,
     get_container_entrypoint,
     get_container_environment_variables,
+    get_container_health,
     get_container_image,
+    get_container_labels,
     get_container_networks,
     get_container_ports,
     get_container_restart_policy,
@@ -25,45 +31,67 @@ from ..utils.docker import (
     stop_container,
     unpause_container,
 )
-from ..utils.events import on_container_change
+from ..utils.history import get_event_history, on_history_change
+from ..utils.icons import new_icon_image
+from ..utils.store import on_container_change
 from ..utils.ui import (
     get_container_action_icon,
     get_container_action_label,
     get_container_status_label,
+    get_event_action_label,
+    get_event_detail_label,
+    get_health_status_label,
     humanize_mount_mode,
     iso_to_local,
+    timestamp_to_local,
 )
 
+TIMELINE_WINDOW_SECONDS = 24 * 60 * 60
 
+
+# pylint: disable=too-many-public-methods
 @Gtk.Template(resource_path="/com/scrlkx/dockery/pages/container_page.ui")
-class ContainerPage(Adw.NavigationPage):
+class ContainerPage(Adw.NavigationPage):  # pylint: disable=too-many-instance-attributes
     __gtype_name__ = "ContainerPage"
 
+    __gsignals__ = {
+        "terminal-requested": (GObject.SignalFlags.RUN_FIRST, None, (str, str)),
+        "files-requested": (GObject.SignalFlags.RUN_FIRST, None, (str, str)),
+    }
+
     name_label = Gtk.Template.Child()
     details_group = Gtk.Template.Child()
     quick_actions_group = Gtk.Template.Child()
+    health_group = Gtk.Template.Child()
+    process_group: ProcessListGroup = Gtk.Template.Child()
+    timeline_group = Gtk.Template.Child()
     environment_group = Gtk.Template.Child()
+    environment_list: KeyValueList = Gtk.Template.Child()
+    labels_group = Gtk.Template.Child()
+    labels_list: KeyValueList = Gtk.Template.Child()
     volumes_group = Gtk.Template.Child()
     networks_group = Gtk.Template.Child()
     ports_group = Gtk.Template.Child()
 
     detail_rows: list[Adw.ActionRow] = []
     quick_action_rows: list[Gtk.Button] = []
-    environment_rows: list[Adw.ActionRow] = []
+    health_rows: list[Adw.ActionRow] = []
+    timeline_rows: list[Adw.ActionRow] = []
     volumes_rows: list[Adw.ActionRow] = []
     networks_rows: list[Adw.ActionRow] = []
     ports_rows: list[Adw.ActionRow] = []
 
     container: Container
 
-    def __init__(self, container: Container):
+    def __init__(self, name: str):
         super().__init__()
 
-        self.container = get_container(container.name)
+        self.container = get_container(name)
 
         self.detail_rows = []
         self.quick_action_rows = []
-        self.environment_rows = []
+        self.health_rows = []
+        self.timeline_rows = []
         self.volumes_rows = []
         self.networks_rows = []
         self.ports_rows = []
@@ -72,12 +100,19 @@ class ContainerPage(Adw.NavigationPage):
         self.build_ui()
 
     def register_events(self) -> None:
-        on_container_change(self.reload_ui, self.container)
+        on_container_change(self.reload_ui, self.container.id, self)
+        on_history_change(self.load_timeline, self.container.id, self)
+
+        self.process_group.watch(self)
 
     def build_ui(self) -> None:
         self.load_details()
         self.load_quick_actions()
+        self.load_health()
+        self.load_processes()
+        self.load_timeline()
         self.load_environment_variables()
+        self.load_labels()
         self.load_volumes()
         self.load_networks()
         self.load_ports()
@@ -135,6 +170,8 @@ class ContainerPage(Adw.NavigationPage):
             "restart": self.on_restart_clicked,
             "kill": self.on_kill_clicked,
             "remove": self.on_remove_clicked,
+            "terminal": self.on_terminal_clicked,
+            "files": self.on_files_clicked,
         }
 
         for row in self.quick_action_rows:
@@ -159,19 +196,104 @@ class ContainerPage(Adw.NavigationPage):
                 self.quick_actions_group.append(button)
                 self.quick_action_rows.append(button)
 
-    def load_environment_variables(self) -> None:
-        variables = get_container_environment_variables(self.container)
+    def load_health(self) -> None:
+        health = get_container_health(self.container)
 
-        for row in self.environment_rows:
-            self.environment_group.remove(row)
+        for row in self.health_rows:
+            self.health_group.remove(row)
 
-        self.environment_rows.clear()
+        self.health_rows.clear()
+        self.health_group.set_visible(health is not None)
+
+        if health is None:
+            return
+
+        status = health.get("Status")
+
+        details = {
+            "Status": get_health_status_label(status) or status or "-",
+            "Failing streak": str(health.get("FailingStreak", 0)),
+        }
 
-        for key, value in variables.items():
+        probes = cast(list[dict[str, Any]], health.get("Log") or [])
+
+        if probes:
+            last = probes[-1]
+
+            ended_at = last.get("End")
+
+            # a check that is still running has no end yet
+            if ended_at:
+                details["Last check"] = iso_to_local(ended_at)
+
+            details["Exit code"] = str(last.get("ExitCode", "-"))
+
+        for key, value in details.items():
             row = KeyValueRow(key, value)
 
-            self.environment_group.add(row)
-            self.environment_rows.append(row)
+            self.health_group.add(row)
+            self.health_rows.append(row)
+
+        if probes and probes[-1].get("Output"):
+            output = Adw.ActionRow(
+                title="Last output",
+                subtitle=probes[-1]["Output"].strip(),
+                use_markup=False,
+            )
+            output.set_subtitle_selectable(True)
+
+            self.health_group.add(output)
+            self.health_rows.append(output)
+
+    def load_processes(self) -> None:
+        self.process_group.set_container(
+            self.container.id, self.container.status == "running"
+        )
+
+    def load_timeline(self) -> None:
+        history = get_event_history()
+
+        since_nano = int((time.time() - TIMELINE_WINDOW_SECONDS) * 1_000_000_000)
+        counts = history.count_actions(self.container.id, since_nano)
+        entries = history.get_timeline(self.container.id)
+
+        for row in self.timeline_rows:
+            self.timeline_group.remove(row)
+
+        self.timeline_rows.clear()
+
+        summary = KeyValueRow(
+            "Last 24 hours",
+            f"{counts.get('start', 0)} starts, {counts.get('die', 0)} exits, "
+            f"{counts.get('oom', 0)} OOM kills",
+        )
+
+        self.timeline_group.add(summary)
+        self.timeline_rows.append(summary)
+
+        for entry in entries:
+            row = KeyValueRow(
+                get_event_action_label(entry["action"]),
+                timestamp_to_local(entry["time_nano"] // 1_000_000_000),
+            )
+            row.set_subtitle(get_event_detail_label(entry["detail"]))
+
+            self.timeline_group.add(row)
+            self.timeline_rows.append(row)
+
+    def load_environment_variables(self) -> None:
+        variables = get_container_environment_variables(self.container)
+
+        self.environment_group.set_visible(bool(variables))
+        self.environment_group.set_description(f"{len(variables)} variables")
+        self.environment_list.set_items(variables)
+
+    def load_labels(self) -> None:
+        labels = get_container_labels(self.container)
+
+        self.labels_group.set_visible(bool(labels))
+        self.labels_group.set_description(f"{len(labels)} labels")
+        self.labels_list.set_items(labels)
 
     def load_volumes(self) -> None:
         volumes = get_container_volumes(self.container)
@@ -225,7 +347,7 @@ class ContainerPage(Adw.NavigationPage):
             valign=Gtk.Align.CENTER,
         )
 
-        image = Gtk.Image.new_from_resource(f"/com/scrlkx/dockery/icons/{icon_name}")
+        image = new_icon_image(icon_name, self.get_scale_factor())
         box.append(image)
 
         label = Gtk.Label(label=label_text)
@@ -264,3 +386,9 @@ class ContainerPage(Adw.NavigationPage):
     def on_remove_clicked(self, _: Gtk.Button) -> None:
         remove_container(self.container.name)
         self.reload_ui()
+
+    def on_terminal_clicked(self, _: Gtk.Button) -> None:
+        self.emit("terminal-requested", self.container.name, self.container.id)
+
+    def on_files_clicked(self, _: Gtk.Button) -> None:
+        self.emit("files-requested", self.container.name, self.container.id)
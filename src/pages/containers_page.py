@@ -1,34 +1,50 @@
-from typing import Any, Callable, List
+from typing import Any, cast
 
 from docker.models.containers import Container
-from gi.repository import Adw, GObject, Gtk
+from gi.repository import Adw, Gio, GLib, GObject, Gtk
 
-from ..components.badge import Badge
+from ..components.container_row import ContainerRow
+from ..components.fleet_overview_group import FleetOverviewGroup
 from ..utils.docker import (
-    get_container_image,
     get_container_next_action,
     get_containers,
     start_container,
     stop_container,
 )
-from ..utils.events import on_containers_change
+from ..utils.flapping import get_flapping_detector
+from ..utils.sorting import (
+    SORT_OPTIONS,
+    ContainerItem,
+    build_container_sorter,
+    get_sort_option,
+)
+from ..utils.store import (
+    REFRESH_RETRY_SECONDS,
+    get_container_store,
+    on_containers_change,
+)
+from ..utils.threads import run_in_background
 from ..utils.ui import (
     get_container_status_class,
     get_container_status_label,
+    get_health_status_class,
+    get_health_status_label,
 )
 
 
-class ContainerRow(Adw.ActionRow):
-    __gtype_name__ = "ContainerRow"
+def build_items(containers: list[Container]) -> list[ContainerItem]:
+    detector = get_flapping_detector()
 
-    name = GObject.Property(type=str)
-    image = GObject.Property(type=str)
-    status_label = GObject.Property(type=str)
-    status_class = GObject.Property(type=str)
+    return [
+        ContainerItem(container, detector.is_flapping(container.id))
+        for container in containers
+    ]
 
 
 @Gtk.Template(resource_path="/com/scrlkx/dockery/pages/containers_page.ui")
-class ContainersPage(Adw.NavigationPage):
+class ContainersPage(
+    Adw.NavigationPage
+):  # pylint: disable=too-many-instance-attributes
     __gtype_name__ = "ContainersPage"
 
     __gsignals__ = {
@@ -36,130 +52,221 @@ class ContainersPage(Adw.NavigationPage):
     }
 
     search_entry = Gtk.Template.Child()
+    overview_group: FleetOverviewGroup = Gtk.Template.Child()
     containers_group = Gtk.Template.Child()
-
-    container_rows: List[ContainerRow] = []
+    containers_list = Gtk.Template.Child()
+    sort_dropdown = Gtk.Template.Child()
+
+    settings: Gio.Settings
+    store: Gio.ListStore
+    items: dict[str, ContainerItem]
+    sort_model: Gtk.SortListModel
+    filter: Gtk.StringFilter
+    facet_filter: Gtk.CustomFilter
+    updating: bool
+    pending_ids: set[str]
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
 
+        self.settings = Gio.Settings(schema_id="com.scrlkx.dockery")
+        self.store = Gio.ListStore(item_type=ContainerItem)
+        self.items = {}
+        self.updating = False
+        self.pending_ids = set()
+
+        self.build_model()
         self.register_events()
         self.build_ui()
 
+    def build_model(self) -> None:
+        sort_key = self.settings.get_string("container-sort")
+
+        # a changed item is re-inserted at its sorted position, other rows stay
+        self.sort_model = Gtk.SortListModel(
+            model=self.store,
+            sorter=build_container_sorter(sort_key),
+        )
+
+        self.filter = Gtk.StringFilter(
+            expression=Gtk.PropertyExpression.new(ContainerItem, None, "name-key"),
+            ignore_case=True,
+            match_mode=Gtk.StringFilterMatchMode.SUBSTRING,
+        )
+
+        # facet membership is a set lookup in the overview, not a scan
+        self.facet_filter = Gtk.CustomFilter.new(self.filter_facet)
+
+        every = Gtk.EveryFilter()
+        every.append(self.filter)
+        every.append(self.facet_filter)
+
+        model = Gtk.FilterListModel(model=self.sort_model, filter=every)
+
+        self.containers_list.bind_model(model, self.build_row)
+
+        labels = [option["label"] for option in SORT_OPTIONS]
+
+        self.sort_dropdown.set_model(Gtk.StringList.new(labels))
+        self.sort_dropdown.set_selected(SORT_OPTIONS.index(get_sort_option(sort_key)))
+
     def register_events(self) -> None:
         self.search_entry.connect("search-changed", self.on_search_changed)
+        self.sort_dropdown.connect("notify::selected", self.on_sort_changed)
+        self.overview_group.connect("facet-changed", self.on_facet_changed)
 
-        on_containers_change(self.reload_ui)
+        on_containers_change(self.on_containers_changed, self)
+        get_flapping_detector().add_listener(self.on_flapping_changed)
 
     def build_ui(self) -> None:
-        containers = get_containers()
+        # the store's first listing reports every container as changed,
+        # which fills the list through the update path instead
+        if not get_container_store().loaded:
+            return
+
+        self.updating = True
+
+        run_in_background(
+            lambda: build_items(get_containers()),
+            self.set_items,
+            "docker_containers_page",
+            self.on_load_failed,
+        )
 
-        for container in containers:
-            row = ContainerRow(title=container.name)
-            row.name = container.name.lower()
-            row.image = get_container_image(container)
-            row.status_label = get_container_status_label(container)
-            row.status_class = get_container_status_class(container)
+    def on_load_failed(self, error: Exception) -> None:
+        self.containers_group.set_description(str(error))
+        self.finish_update()
 
-            row.set_activatable(True)
-            row.connect("activated", self.on_container_row_clicked, container)
+    def set_items(self, items: list[ContainerItem]) -> None:
+        self.containers_group.set_description(None)
+        self.items = {item.container_id: item for item in items}
+        self.overview_group.reset(items)
+        self.store.splice(0, self.store.get_n_items(), items)
 
-            self.container_rows.append(row)
+        self.finish_update()
 
-            if row.image:
-                image = Badge(
-                    text=row.image,
-                    margin_end=12,
-                )
+    def on_containers_changed(self, container_ids: set[str]) -> None:
+        self.pending_ids.update(container_ids)
 
-                row.add_suffix(image)
+        if not self.updating:
+            self.fetch_pending()
 
-            if row.status_label and row.status_class:
-                status = Badge(
-                    text=row.status_label,
-                    style_class=row.status_class,
-                    margin_end=12,
-                )
+    def on_flapping_changed(self, container_id: str, _: str, __: bool) -> None:
+        # called from the event reader thread or the expiry timer, the badge
+        # and sort rank come with the refetched item
+        GLib.idle_add(self.on_containers_changed, {container_id})
 
-                row.add_suffix(status)
+    def fetch_pending(self) -> None:
+        ids = list(self.pending_ids)
 
-            next_action = get_container_next_action(container)
+        self.pending_ids.clear()
+        self.updating = True
 
-            if next_action == "start":
-                button = self.build_next_action_button(
-                    container,
-                    self.row_start_container,
-                    "play.svg",
-                )
+        run_in_background(
+            lambda: build_items(get_containers(ids)),
+            lambda items: self.update_items(ids, items),
+            "docker_containers_page_update",
+            lambda error: self.on_update_failed(ids, error),
+        )
 
-                row.add_suffix(button)
-            elif next_action == "stop":
-                button = self.build_next_action_button(
-                    container,
-                    self.row_stop_container,
-                    "circle-crossed.svg",
-                )
+    def finish_update(self) -> None:
+        self.updating = False
 
-                row.add_suffix(button)
+        # one fetch at a time, so an older result never lands after a newer one
+        if self.pending_ids:
+            self.fetch_pending()
 
-            info = Gtk.Image.new_from_resource(
-                "/com/scrlkx/dockery/icons/chevron-right.svg"
-            )
-            info.add_css_class("flat")
+    def on_update_failed(self, container_ids: list[str], error: Exception) -> None:
+        # still updating until the retry, so changes meanwhile join its batch
+        self.pending_ids.update(container_ids)
+        self.containers_group.set_description(str(error))
 
-            row.add_suffix(info)
+        GLib.timeout_add_seconds(REFRESH_RETRY_SECONDS, self.retry_update)
 
-            self.containers_group.add(row)
+    def retry_update(self) -> bool:
+        self.finish_update()
 
-    def reload_ui(self) -> None:
-        for row in self.container_rows:
-            self.containers_group.remove(row)
+        return False
 
-        self.container_rows.clear()
-        self.build_ui()
+    def update_items(
+        self, container_ids: list[str], items: list[ContainerItem]
+    ) -> None:
+        found = {item.container_id: item for item in items}
+
+        for container_id in container_ids:
+            old = self.items.pop(container_id, None)
+            new = found.get(container_id)
+
+            if new is not None:
+                self.items[container_id] = new
+
+            # updated first so the facet filter sees the new membership
+            self.overview_group.update(container_id, new)
+
+            exists, position = self.store.find(old) if old else (False, 0)
+
+            # replacing one item only re-sorts and rebuilds that row
+            if exists:
+                self.store.splice(position, 1, [new] if new else [])
+            elif new:
+                self.store.append(new)
+
+        self.containers_group.set_description(None)
+        self.finish_update()
 
-    def build_next_action_button(
-        self,
-        container: Container,
-        callback: Callable[[Gtk.Button, Container], None],
-        icon_name: str,
-    ) -> Gtk.Button:
-        button = Gtk.Button()
-        button.add_css_class("flat")
-        button.set_valign(Gtk.Align.CENTER)
-        button.set_margin_end(12)
-
-        image = Gtk.Image.new_from_resource(f"/com/scrlkx/dockery/icons/{icon_name}")
-
-        box = Gtk.Box(
-            orientation=Gtk.Orientation.HORIZONTAL,
-            spacing=6,
-            halign=Gtk.Align.CENTER,
-            valign=Gtk.Align.CENTER,
+    def build_row(self, item: GObject.Object) -> Gtk.Widget:
+        item = cast(ContainerItem, item)
+        container = item.container
+
+        row = ContainerRow(scale=self.get_scale_factor(), title=item.name)
+        row.name = item.name_key
+        row.flapping = item.flapping_rank == 0
+
+        row.set_image(item.image)
+        row.set_status(
+            get_container_status_label(container),
+            get_container_status_class(container),
         )
+        row.set_health(*self.get_health_badge(container))
+        row.set_next_action(get_container_next_action(container))
+
+        row.connect("activated", self.on_container_row_clicked, container)
+        row.connect("next-action", self.on_row_next_action, container)
+
+        return row
 
-        box.append(image)
+    def get_health_badge(self, container: Container) -> tuple[str | None, str | None]:
+        if container.status != "running":
+            return (None, None)
 
-        button.set_child(box)
+        # kept current by health_status events, no inspect needed
+        health = get_container_store().get_health(container.id)
 
-        button.connect("clicked", callback, container)
+        return (get_health_status_label(health), get_health_status_class(health))
 
-        return button
+    def filter_facet(self, item: GObject.Object) -> bool:
+        return self.overview_group.matches(cast(ContainerItem, item).container_id)
 
     def on_search_changed(self, entry: Gtk.SearchEntry) -> None:
-        text = entry.get_text().lower()
+        self.filter.set_search(entry.get_text())
 
-        for row in self.container_rows:
-            visible = text in row.name
-            row.set_visible(visible)
+    def on_facet_changed(self, _: FleetOverviewGroup) -> None:
+        self.facet_filter.changed(Gtk.FilterChange.DIFFERENT)
+
+    def on_sort_changed(self, dropdown: Gtk.DropDown, _: GObject.ParamSpec) -> None:
+        option = SORT_OPTIONS[dropdown.get_selected()]
+
+        self.settings.set_string("container-sort", option["key"])
+        self.sort_model.set_sorter(build_container_sorter(option["key"]))
 
     def on_container_row_clicked(self, _: Gtk.ListBoxRow, container: Container) -> None:
         self.emit("container-activated", container)
 
-    def row_start_container(self, _: Any, container: Container) -> None:
-        start_container(container.name)
-        self.reload_ui()
-
-    def row_stop_container(self, _: Any, container: Container) -> None:
-        stop_container(container.name)
-        self.reload_ui()
+    def on_row_next_action(
+        self, _: ContainerRow, next_action: str, container: Container
+    ) -> None:
+        # the resulting events move the row, no reload needed
+        if next_action == "start":
+            start_container(container.name)
+        elif next_action == "stop":
+            stop_container(container.name)
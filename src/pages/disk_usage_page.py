@@ -0,0 +1,150 @@
+from typing import Any
+
+from gi.repository import Adw, GLib, GObject, Gtk
+
+from ..components.badge import Badge
+from ..components.key_value_row import KeyValueRow
+from ..utils.disk_usage import DiskUsage, ImageUsage, get_disk_usage
+from ..utils.threads import run_in_background
+from ..utils.ui import get_disk_usage_label, short_id, timestamp_to_local
+
+
+@Gtk.Template(resource_path="/com/scrlkx/dockery/pages/disk_usage_page.ui")
+class DiskUsagePage(Adw.NavigationPage):
+    __gtype_name__ = "DiskUsagePage"
+
+    refresh_button = Gtk.Template.Child()
+    summary_group = Gtk.Template.Child()
+    layers_group = Gtk.Template.Child()
+    images_group = Gtk.Template.Child()
+
+    summary_rows: list[Adw.ActionRow] = []
+    layers_rows: list[Adw.ActionRow] = []
+    image_rows: list[Adw.ExpanderRow] = []
+    expanded_images: set[str] = set()
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+
+        self.summary_rows = []
+        self.layers_rows = []
+        self.image_rows = []
+        self.expanded_images = set()
+
+        self.register_events()
+        self.load_disk_usage()
+
+    def register_events(self) -> None:
+        self.refresh_button.connect("clicked", self.on_refresh_clicked)
+
+    def load_disk_usage(self, refresh: bool = False) -> None:
+        self.refresh_button.set_sensitive(False)
+
+        run_in_background(
+            lambda: get_disk_usage(refresh),
+            self.build_ui,
+            "docker_disk_usage",
+            self.on_load_failed,
+        )
+
+    def on_load_failed(self, error: Exception) -> None:
+        self.summary_group.set_description(str(error))
+        self.refresh_button.set_sensitive(True)
+
+    def build_ui(self, usage: DiskUsage) -> None:
+        self.summary_group.set_description(None)
+        self.load_summary(usage)
+        self.load_layers(usage)
+        self.load_images(usage)
+
+        self.refresh_button.set_sensitive(True)
+
+    def load_summary(self, usage: DiskUsage) -> None:
+        for row in self.summary_rows:
+            self.summary_group.remove(row)
+
+        self.summary_rows.clear()
+
+        for category, summary in usage["summaries"].items():
+            size = GLib.format_size(summary["size"])
+            reclaimable = GLib.format_size(summary["reclaimable"])
+
+            row = KeyValueRow(
+                get_disk_usage_label(category) or category,
+                f"{size} ({reclaimable} reclaimable)",
+            )
+            row.set_subtitle(f"{summary['count']} total, {summary['active']} active")
+
+            self.summary_group.add(row)
+            self.summary_rows.append(row)
+
+    def load_layers(self, usage: DiskUsage) -> None:
+        for row in self.layers_rows:
+            self.layers_group.remove(row)
+
+        self.layers_rows.clear()
+
+        sizes = {
+            "Total": usage["layers_size"],
+            "Shared between images": usage["shared_size"],
+            "Unique to one image": usage["unique_size"],
+        }
+
+        for key, value in sizes.items():
+            row = KeyValueRow(key, GLib.format_size(value))
+
+            self.layers_group.add(row)
+            self.layers_rows.append(row)
+
+    def load_images(self, usage: DiskUsage) -> None:
+        for row in self.image_rows:
+            self.images_group.remove(row)
+
+        self.image_rows.clear()
+        self.expanded_images.clear()
+
+        for image in usage["images"]:
+            unique = GLib.format_size(image["unique_size"])
+            shared = GLib.format_size(image["shared_size"])
+
+            row = Adw.ExpanderRow(
+                title=image["tags"][0] if image["tags"] else short_id(image["id"]),
+                subtitle=f"{unique} unique, {shared} shared",
+            )
+
+            if image["containers"] == 0:
+                row.add_suffix(Badge(text="Unused", style_class="tag-gray"))
+
+            row.add_suffix(Gtk.Label(label=GLib.format_size(image["size"])))
+
+            # details are only built the first time a row is expanded
+            row.connect("notify::expanded", self.on_image_expanded, image)
+
+            self.images_group.add(row)
+            self.image_rows.append(row)
+
+    def load_image_details(self, row: Adw.ExpanderRow, image: ImageUsage) -> None:
+        details = {
+            "ID": short_id(image["id"]),
+            "Tags": ", ".join(image["tags"]) or "-",
+            "Created at": timestamp_to_local(image["created"]),
+            "Size": GLib.format_size(image["size"]),
+            "Shared size": GLib.format_size(image["shared_size"]),
+            "Unique size": GLib.format_size(image["unique_size"]),
+            "Containers": str(image["containers"]),
+        }
+
+        for key, value in details.items():
+            row.add_row(KeyValueRow(key, value))
+
+    def on_image_expanded(
+        self, row: Adw.ExpanderRow, _: GObject.ParamSpec, image: ImageUsage
+    ) -> None:
+        if not row.get_expanded() or image["id"] in self.expanded_images:
+            return
+
+        self.expanded_images.add(image["id"])
+        self.load_image_details(row, image)
+
+    def on_refresh_clicked(self, _: Gtk.Button) -> None:
+        self.load_disk_usage(refresh=True)
@@ -0,0 +1,284 @@
+import posixpath
+import tarfile
+from collections.abc import Callable
+from typing import cast
+
+from docker.errors import DockerException
+from gi.repository import Adw, Gio, GLib, Gtk
+from requests.exceptions import RequestException
+
+from ..components.resource_row import ResourceRow
+from ..utils.archive import (
+    PathStat,
+    Transfer,
+    TransferCancelled,
+    download,
+    get_archive_size,
+    is_directory,
+    is_symlink,
+    list_directory,
+    stat_path,
+    upload,
+)
+from ..utils.lifecycle import Activity, get_lifecycle
+from ..utils.threads import run_in_background
+from ..utils.ui import iso_to_local
+
+DirectoryEntry = tuple[str, PathStat]
+
+
+def load_directory(container_id: str, path: str) -> tuple[list[DirectoryEntry], str]:
+    try:
+        stat = stat_path(container_id, path)
+
+        # docker resolves the whole link, its target tells a directory
+        if is_symlink(stat) and stat["linkTarget"]:
+            stat = stat_path(container_id, stat["linkTarget"])
+    except (DockerException, RequestException) as error:
+        return ([], str(error))
+
+    if not is_directory(stat):
+        return ([(path, stat)], "")
+
+    try:
+        entries = list_directory(container_id, path)
+    except DockerException:
+        # listing runs ls in the container, the directory can still be copied
+        return ([(path, stat)], "Start the container to list directories")
+    except OSError as error:
+        return ([(path, stat)], str(error))
+
+    return ([(posixpath.join(path, entry["name"]), entry) for entry in entries], "")
+
+
+@Gtk.Template(resource_path="/com/scrlkx/dockery/pages/files_page.ui")
+class FilesPage(Adw.NavigationPage):
+    __gtype_name__ = "FilesPage"
+
+    path_row = Gtk.Template.Child()
+    transfer_group = Gtk.Template.Child()
+    transfer_row = Gtk.Template.Child()
+    cancel_button = Gtk.Template.Child()
+    progress_bar = Gtk.Template.Child()
+    entries_group = Gtk.Template.Child()
+    up_button = Gtk.Template.Child()
+    upload_button = Gtk.Template.Child()
+
+    container_id: str
+    path: str
+    entry_rows: list[ResourceRow]
+    transfer: Transfer | None
+    closed: bool
+
+    def __init__(self, name: str, container_id: str):
+        super().__init__()
+
+        self.container_id = container_id
+        self.path = "/"
+        self.entry_rows = []
+        self.transfer = None
+        self.closed = False
+
+        self.set_title(f"{name} Files")
+
+        get_lifecycle().watch(self, self.on_activity_changed)
+
+        self.register_events()
+        self.load("/")
+
+    def register_events(self) -> None:
+        self.path_row.connect("apply", self.on_path_applied)
+        self.up_button.connect("clicked", self.on_up_clicked)
+        self.upload_button.connect("clicked", self.on_upload_clicked)
+        self.cancel_button.connect("clicked", self.on_cancel_clicked)
+
+    def load(self, path: str) -> None:
+        self.path = posixpath.normpath(path)
+        self.path_row.set_text(self.path)
+        self.up_button.set_sensitive(self.path != "/")
+
+        run_in_background(
+            lambda: load_directory(self.container_id, self.path),
+            self.build_entries,
+            "docker_list_directory",
+            lambda error: self.build_entries(([], str(error))),
+        )
+
+    def build_entries(self, result: tuple[list[DirectoryEntry], str]) -> None:
+        if self.closed:
+            return
+
+        entries, message = result
+
+        for row in self.entry_rows:
+            self.entries_group.remove(row)
+
+        self.entry_rows.clear()
+        self.entries_group.set_description(message or None)
+
+        # directories first, then by name
+        entries.sort(key=lambda entry: (not is_directory(entry[1]), entry[0]))
+
+        for path, entry in entries:
+            row = self.build_entry_row(path, entry)
+
+            self.entries_group.add(row)
+            self.entry_rows.append(row)
+
+    def build_entry_row(self, path: str, entry: PathStat) -> ResourceRow:
+        directory = is_directory(entry)
+
+        details = [iso_to_local(entry["mtime"])]
+
+        if not directory:
+            details.insert(0, GLib.format_size(entry["size"]))
+
+        row = ResourceRow(entry["name"], " · ".join(details))
+
+        download_button = Gtk.Button(
+            icon_name="folder-download-symbolic",
+            tooltip_text="Download",
+            valign=Gtk.Align.CENTER,
+        )
+        download_button.add_css_class("flat")
+        download_button.connect("clicked", self.on_download_clicked, entry, path)
+
+        row.add_suffix(download_button)
+
+        if directory and path != self.path:
+            row.add_chevron()
+            row.connect("activated", self.on_entry_activated, path)
+        else:
+            row.set_activatable(False)
+
+        return row
+
+    def start_transfer(
+        self, title: str, total: int, work: Callable[[Transfer], None]
+    ) -> None:
+        transfer = Transfer(total, self.on_transfer_progress)
+        self.transfer = transfer
+
+        self.transfer_group.set_visible(True)
+        self.transfer_row.set_title(title)
+        self.transfer_row.set_subtitle("")
+        self.progress_bar.set_fraction(0)
+        self.cancel_button.set_sensitive(True)
+        self.upload_button.set_sensitive(False)
+
+        def _run() -> str:
+            try:
+                work(transfer)
+            except TransferCancelled:
+                return "Cancelled"
+            except (DockerException, OSError, tarfile.TarError) as error:
+                return str(error)
+
+            return "Done"
+
+        run_in_background(
+            _run,
+            self.on_transfer_done,
+            "docker_archive_transfer",
+            lambda error: self.on_transfer_done(str(error)),
+        )
+
+    def on_transfer_progress(self, done: int, total: int) -> None:
+        if self.closed:
+            return
+
+        if total:
+            self.progress_bar.set_fraction(min(done / total, 1))
+            self.transfer_row.set_subtitle(
+                f"{GLib.format_size(done)} of {GLib.format_size(total)}"
+            )
+        else:
+            self.progress_bar.pulse()
+            self.transfer_row.set_subtitle(GLib.format_size(done))
+
+    def on_transfer_done(self, status: str) -> None:
+        self.transfer = None
+
+        if self.closed:
+            return
+
+        if status == "Done":
+            self.progress_bar.set_fraction(1)
+
+        self.transfer_row.set_subtitle(status)
+        self.cancel_button.set_sensitive(False)
+        self.upload_button.set_sensitive(True)
+
+        self.load(self.path)
+
+    def on_activity_changed(self, activity: Activity) -> None:
+        if activity == Activity.REMOVED:
+            self.closed = True
+
+            if self.transfer:
+                self.transfer.cancel()
+
+    def on_cancel_clicked(self, _: Gtk.Button) -> None:
+        if self.transfer:
+            self.transfer.cancel()
+
+    def on_entry_activated(self, _: ResourceRow, path: str) -> None:
+        self.load(path)
+
+    def on_path_applied(self, row: Adw.EntryRow) -> None:
+        self.load(row.get_text() or "/")
+
+    def on_up_clicked(self, _: Gtk.Button) -> None:
+        self.load(posixpath.dirname(self.path))
+
+    def on_download_clicked(self, _: Gtk.Button, entry: PathStat, path: str) -> None:
+        if self.transfer:
+            return
+
+        def _on_selected(dialog: Gtk.FileDialog, result: Gio.AsyncResult) -> None:
+            try:
+                folder = dialog.select_folder_finish(result)
+            except GLib.Error:
+                return
+
+            destination = folder.get_path() if folder else None
+
+            if not destination:
+                return
+
+            self.start_transfer(
+                f"Downloading {entry['name']}",
+                0 if is_directory(entry) else get_archive_size(entry["size"]),
+                lambda transfer: download(
+                    self.container_id, path, destination, transfer
+                ),
+            )
+
+        dialog = Gtk.FileDialog(title="Download To")
+        dialog.select_folder(cast(Gtk.Window, self.get_root()), None, _on_selected)
+
+    def on_upload_clicked(self, _: Gtk.Button) -> None:
+        if self.transfer:
+            return
+
+        target = self.path
+
+        def _on_selected(dialog: Gtk.FileDialog, result: Gio.AsyncResult) -> None:
+            try:
+                file = dialog.open_finish(result)
+            except GLib.Error:
+                return
+
+            source = file.get_path() if file else None
+
+            if not source:
+                return
+
+            self.start_transfer(
+                f"Uploading {posixpath.basename(source)}",
+                0,
+                lambda transfer: upload(source, self.container_id, target, transfer),
+            )
+
+        dialog = Gtk.FileDialog(title="Upload File")
+        dialog.open(cast(Gtk.Window, self.get_root()), None, _on_selected)
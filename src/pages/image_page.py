@@ -0,0 +1,114 @@
+from typing import cast
+
+from gi.repository import Adw, GLib, GObject, Gtk
+
+from ..components.key_value_row import KeyValueRow
+from ..components.pull_group import PullGroup
+from ..components.resource_row import ResourceRow
+from ..utils.docker import (
+    DockerSummary,
+    get_image_tags,
+    get_summary_attribute,
+    get_summary_labels,
+    inspect_image,
+)
+from ..utils.index import get_container_index
+from ..utils.threads import run_in_background
+from ..utils.ui import iso_to_local, short_id
+
+
+@Gtk.Template(resource_path="/com/scrlkx/dockery/pages/image_page.ui")
+class ImagePage(Adw.NavigationPage):
+    __gtype_name__ = "ImagePage"
+
+    __gsignals__ = {
+        "container-activated": (GObject.SignalFlags.RUN_FIRST, None, (str,))
+    }
+
+    name_label = Gtk.Template.Child()
+    details_group = Gtk.Template.Child()
+    pull_group: PullGroup = Gtk.Template.Child()
+    labels_group = Gtk.Template.Child()
+    containers_group = Gtk.Template.Child()
+
+    image_id: str
+
+    def __init__(self, image_id: str):
+        super().__init__()
+
+        self.image_id = image_id
+
+        self.set_title(short_id(image_id))
+        self.name_label.set_text(short_id(image_id))
+
+        run_in_background(
+            lambda: inspect_image(self.image_id),
+            self.build_ui,
+            "docker_inspect_image",
+            self.on_load_failed,
+        )
+
+    def on_load_failed(self, error: Exception) -> None:
+        self.details_group.set_description(str(error))
+
+    def build_ui(self, image: DockerSummary) -> None:
+        self.load_details(image)
+        self.load_labels(image)
+        self.load_containers()
+
+    def load_details(self, image: DockerSummary) -> None:
+        tags = get_image_tags(image)
+        digests = cast(list[str], image.get("RepoDigests") or [])
+
+        if tags:
+            self.set_title(tags[0])
+            self.name_label.set_text(tags[0])
+
+            # pulling the tag again fetches whatever it points to now
+            self.pull_group.set_reference(tags[0])
+            self.pull_group.set_visible(True)
+
+        details = {
+            "ID": short_id(self.image_id),
+            "Tags": ", ".join(tags) or "-",
+            "Digests": ", ".join(digests) or "-",
+        }
+
+        created_at = image.get("Created")
+
+        if created_at:
+            details["Created at"] = iso_to_local(created_at)
+
+        details["Size"] = GLib.format_size(image.get("Size", 0))
+        details["Platform"] = f"{image.get('Os', '-')}/{image.get('Architecture', '-')}"
+
+        cmd = get_summary_attribute(image, "Config.Cmd")
+
+        if cmd:
+            details["CMD"] = " ".join(cast(list[str], cmd))
+
+        for key, value in details.items():
+            self.details_group.add(KeyValueRow(key, value))
+
+    def load_labels(self, image: DockerSummary) -> None:
+        labels = get_summary_labels(image, "Config.Labels")
+
+        self.labels_group.set_visible(bool(labels))
+
+        for key, value in labels.items():
+            self.labels_group.add(KeyValueRow(key, value))
+
+    def load_containers(self) -> None:
+        names = get_container_index().get_image_containers(self.image_id)
+
+        self.containers_group.set_visible(bool(names))
+
+        for name in names:
+            row = ResourceRow(title=name)
+            row.connect("activated", self.on_container_row_clicked, name)
+            row.add_chevron()
+
+            self.containers_group.add(row)
+
+    def on_container_row_clicked(self, _: Gtk.ListBoxRow, name: str) -> None:
+        self.emit("container-activated", name)
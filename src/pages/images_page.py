@@ -0,0 +1,112 @@
+from typing import Any
+
+from gi.repository import Adw, GLib, GObject, Gtk
+
+from ..components.pull_group import PullGroup
+from ..components.resource_row import ResourceRow
+from ..utils.docker import DockerSummary, build_filters, get_image_tags, list_images
+from ..utils.index import ContainerIndex, get_container_index
+from ..utils.threads import run_in_background
+from ..utils.ui import short_id
+
+
+@Gtk.Template(resource_path="/com/scrlkx/dockery/pages/images_page.ui")
+class ImagesPage(Adw.NavigationPage):
+    __gtype_name__ = "ImagesPage"
+
+    __gsignals__ = {"image-activated": (GObject.SignalFlags.RUN_FIRST, None, (str,))}
+
+    search_entry = Gtk.Template.Child()
+    dangling_row = Gtk.Template.Child()
+    label_row = Gtk.Template.Child()
+    pull_group: PullGroup = Gtk.Template.Child()
+    images_group = Gtk.Template.Child()
+    refresh_button = Gtk.Template.Child()
+
+    image_rows: list[ResourceRow] = []
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+
+        self.image_rows = []
+
+        self.register_events()
+        self.reload_ui()
+
+    def register_events(self) -> None:
+        self.search_entry.connect("search-changed", self.on_search_changed)
+        self.dangling_row.connect("notify::active", self.on_filters_changed)
+        self.label_row.connect("apply", self.on_filters_changed)
+        self.refresh_button.connect("clicked", self.on_filters_changed)
+        self.pull_group.connect("finished", self.on_pull_finished)
+
+    def reload_ui(self) -> None:
+        filters = build_filters(
+            dangling=self.dangling_row.get_active(),
+            label=self.label_row.get_text().strip(),
+        )
+
+        self.refresh_button.set_sensitive(False)
+
+        run_in_background(
+            lambda: (list_images(filters), get_container_index(refresh=True)),
+            self.build_ui,
+            "docker_list_images",
+            self.on_load_failed,
+        )
+
+    def on_load_failed(self, error: Exception) -> None:
+        self.images_group.set_description(str(error))
+        self.refresh_button.set_sensitive(True)
+
+    def build_ui(self, result: tuple[list[DockerSummary], ContainerIndex]) -> None:
+        images, index = result
+
+        self.images_group.set_description(None)
+
+        for row in self.image_rows:
+            self.images_group.remove(row)
+
+        self.image_rows.clear()
+
+        for image in images:
+            image_id = image.get("Id", "")
+            tags = get_image_tags(image)
+
+            row = ResourceRow(
+                title=tags[0] if tags else short_id(image_id),
+                subtitle=short_id(image_id),
+            )
+            row.connect("activated", self.on_image_row_clicked, image_id)
+
+            if not tags:
+                row.add_badge("Dangling", "tag-orange")
+
+            if not index.get_image_containers(image_id):
+                row.add_badge("Unused", "tag-gray")
+
+            row.add_badge(GLib.format_size(image.get("Size", 0)))
+            row.add_chevron()
+
+            self.images_group.add(row)
+            self.image_rows.append(row)
+
+        self.on_search_changed(self.search_entry)
+        self.refresh_button.set_sensitive(True)
+
+    def on_search_changed(self, entry: Gtk.SearchEntry) -> None:
+        text = entry.get_text().lower()
+
+        for row in self.image_rows:
+            visible = text in row.name
+            row.set_visible(visible)
+
+    def on_filters_changed(self, *_: Any) -> None:
+        self.reload_ui()
+
+    def on_pull_finished(self, _: PullGroup, error: str) -> None:
+        if not error:
+            self.reload_ui()
+
+    def on_image_row_clicked(self, _: Gtk.ListBoxRow, image_id: str) -> None:
+        self.emit("image-activated", image_id)
@@ -0,0 +1,112 @@
+from typing import Any, cast
+
+from gi.repository import Adw, GObject, Gtk
+
+from ..components.key_value_row import KeyValueRow
+from ..components.resource_row import ResourceRow
+from ..utils.docker import (
+    DockerSummary,
+    get_summary_attribute,
+    get_summary_labels,
+    inspect_network,
+)
+from ..utils.index import get_container_index
+from ..utils.threads import run_in_background
+from ..utils.ui import iso_to_local, short_id
+
+
+@Gtk.Template(resource_path="/com/scrlkx/dockery/pages/network_page.ui")
+class NetworkPage(Adw.NavigationPage):
+    __gtype_name__ = "NetworkPage"
+
+    __gsignals__ = {
+        "container-activated": (GObject.SignalFlags.RUN_FIRST, None, (str,))
+    }
+
+    name_label = Gtk.Template.Child()
+    details_group = Gtk.Template.Child()
+    labels_group = Gtk.Template.Child()
+    containers_group = Gtk.Template.Child()
+
+    network_id: str
+
+    def __init__(self, network_id: str):
+        super().__init__()
+
+        self.network_id = network_id
+
+        self.set_title(short_id(network_id))
+        self.name_label.set_text(short_id(network_id))
+
+        run_in_background(
+            lambda: inspect_network(self.network_id),
+            self.build_ui,
+            "docker_inspect_network",
+            self.on_load_failed,
+        )
+
+    def on_load_failed(self, error: Exception) -> None:
+        self.details_group.set_description(str(error))
+
+    def build_ui(self, network: DockerSummary) -> None:
+        self.load_details(network)
+        self.load_labels(network)
+        self.load_containers()
+
+    def load_details(self, network: DockerSummary) -> None:
+        name = network.get("Name", short_id(self.network_id))
+
+        self.set_title(name)
+        self.name_label.set_text(name)
+
+        details = {
+            "ID": short_id(self.network_id),
+            "Driver": network.get("Driver", "-"),
+            "Scope": network.get("Scope", "-"),
+            "Internal": "Yes" if network.get("Internal") else "No",
+            "Attachable": "Yes" if network.get("Attachable") else "No",
+        }
+
+        created_at = network.get("Created")
+
+        if created_at:
+            details["Created at"] = iso_to_local(created_at)
+
+        configs = cast(
+            list[dict[str, Any]], get_summary_attribute(network, "IPAM.Config") or []
+        )
+
+        subnets = [config["Subnet"] for config in configs if config.get("Subnet")]
+        gateways = [config["Gateway"] for config in configs if config.get("Gateway")]
+
+        if subnets:
+            details["Subnets"] = ", ".join(subnets)
+
+        if gateways:
+            details["Gateways"] = ", ".join(gateways)
+
+        for key, value in details.items():
+            self.details_group.add(KeyValueRow(key, value))
+
+    def load_labels(self, network: DockerSummary) -> None:
+        labels = get_summary_labels(network)
+
+        self.labels_group.set_visible(bool(labels))
+
+        for key, value in labels.items():
+            self.labels_group.add(KeyValueRow(key, value))
+
+    def load_containers(self) -> None:
+        names = get_container_index().get_network_containers(self.network_id)
+
+        self.containers_group.set_visible(bool(names))
+
+        for name in names:
+            row = ResourceRow(title=name)
+            row.connect("activated", self.on_container_row_clicked, name)
+            row.add_chevron()
+
+            self.containers_group.add(row)
+
+    def on_container_row_clicked(self, _: Gtk.ListBoxRow, name: str) -> None:
+        self.emit("container-activated", name)
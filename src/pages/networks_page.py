@@ -0,0 +1,106 @@
+from typing import Any
+
+from gi.repository import Adw, GObject, Gtk
+
+from ..components.resource_row import ResourceRow
+from ..utils.docker import DockerSummary, build_filters, list_networks
+from ..utils.index import ContainerIndex, get_container_index
+from ..utils.threads import run_in_background
+from ..utils.ui import short_id
+
+
+@Gtk.Template(resource_path="/com/scrlkx/dockery/pages/networks_page.ui")
+class NetworksPage(Adw.NavigationPage):
+    __gtype_name__ = "NetworksPage"
+
+    __gsignals__ = {"network-activated": (GObject.SignalFlags.RUN_FIRST, None, (str,))}
+
+    search_entry = Gtk.Template.Child()
+    dangling_row = Gtk.Template.Child()
+    label_row = Gtk.Template.Child()
+    driver_row = Gtk.Template.Child()
+    networks_group = Gtk.Template.Child()
+    refresh_button = Gtk.Template.Child()
+
+    network_rows: list[ResourceRow] = []
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+
+        self.network_rows = []
+
+        self.register_events()
+        self.reload_ui()
+
+    def register_events(self) -> None:
+        self.search_entry.connect("search-changed", self.on_search_changed)
+        self.dangling_row.connect("notify::active", self.on_filters_changed)
+        self.label_row.connect("apply", self.on_filters_changed)
+        self.driver_row.connect("apply", self.on_filters_changed)
+        self.refresh_button.connect("clicked", self.on_filters_changed)
+
+    def reload_ui(self) -> None:
+        filters = build_filters(
+            dangling=self.dangling_row.get_active(),
+            label=self.label_row.get_text().strip(),
+            driver=self.driver_row.get_text().strip(),
+        )
+
+        self.refresh_button.set_sensitive(False)
+
+        run_in_background(
+            lambda: (list_networks(filters), get_container_index(refresh=True)),
+            self.build_ui,
+            "docker_list_networks",
+            self.on_load_failed,
+        )
+
+    def on_load_failed(self, error: Exception) -> None:
+        self.networks_group.set_description(str(error))
+        self.refresh_button.set_sensitive(True)
+
+    def build_ui(self, result: tuple[list[DockerSummary], ContainerIndex]) -> None:
+        networks, index = result
+
+        self.networks_group.set_description(None)
+
+        for row in self.network_rows:
+            self.networks_group.remove(row)
+
+        self.network_rows.clear()
+
+        for network in networks:
+            network_id = network.get("Id", "")
+
+            row = ResourceRow(
+                title=network.get("Name", short_id(network_id)),
+                subtitle=short_id(network_id),
+            )
+            row.connect("activated", self.on_network_row_clicked, network_id)
+
+            containers = index.get_network_containers(network_id)
+
+            if containers:
+                row.add_badge(f"{len(containers)} containers", "tag-blue")
+
+            row.add_badge(network.get("Driver", "-"))
+            row.add_chevron()
+
+            self.networks_group.add(row)
+            self.network_rows.append(row)
+
+        self.on_search_changed(self.search_entry)
+        self.refresh_button.set_sensitive(True)
+
+    def on_search_changed(self, entry: Gtk.SearchEntry) -> None:
+        text = entry.get_text().lower()
+
+        for row in self.network_rows:
+            visible = text in row.name
+            row.set_visible(visible)
+
+    def on_filters_changed(self, *_: Any) -> None:
+        self.reload_ui()
+
+    def on_network_row_clicked(self, _: Gtk.ListBoxRow, network_id: str) -> None:
+        self.emit("network-activated", network_id)
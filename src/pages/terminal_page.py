@@ -0,0 +1,29 @@
+from gi.repository import Adw, Gtk
+
+from ..components.exec_terminal import ExecTerminal
+from ..utils.lifecycle import Activity, get_lifecycle
+
+
+@Gtk.Template(resource_path="/com/scrlkx/dockery/pages/terminal_page.ui")
+class TerminalPage(Adw.NavigationPage):
+    __gtype_name__ = "TerminalPage"
+
+    terminal: ExecTerminal = Gtk.Template.Child()
+
+    def __init__(self, name: str, container_id: str):
+        super().__init__()
+
+        self.set_title(f"{name} Terminal")
+
+        get_lifecycle().watch(self, self.on_activity_changed)
+
+        self.terminal.attach(container_id)
+        self.terminal.grab_focus()
+
+    def on_activity_changed(self, activity: Activity) -> None:
+        if activity == Activity.REMOVED:
+            self.terminal.close()
+
+    @Gtk.Template.Callback()
+    def on_exited(self, _: ExecTerminal, exit_code: int) -> None:
+        self.terminal.feed(f"\r\n[Process exited with code {exit_code}]\r\n".encode())
@@ -0,0 +1,86 @@
+from gi.repository import Adw, GObject, Gtk
+
+from ..components.key_value_row import KeyValueRow
+from ..components.resource_row import ResourceRow
+from ..utils.docker import DockerSummary, get_summary_labels, inspect_volume
+from ..utils.index import get_container_index
+from ..utils.threads import run_in_background
+from ..utils.ui import iso_to_local
+
+
+@Gtk.Template(resource_path="/com/scrlkx/dockery/pages/volume_page.ui")
+class VolumePage(Adw.NavigationPage):
+    __gtype_name__ = "VolumePage"
+
+    __gsignals__ = {
+        "container-activated": (GObject.SignalFlags.RUN_FIRST, None, (str,))
+    }
+
+    name_label = Gtk.Template.Child()
+    details_group = Gtk.Template.Child()
+    labels_group = Gtk.Template.Child()
+    containers_group = Gtk.Template.Child()
+
+    volume_name: str
+
+    def __init__(self, name: str):
+        super().__init__()
+
+        self.volume_name = name
+
+        self.set_title(name)
+        self.name_label.set_text(name)
+
+        run_in_background(
+            lambda: inspect_volume(self.volume_name),
+            self.build_ui,
+            "docker_inspect_volume",
+            self.on_load_failed,
+        )
+
+    def on_load_failed(self, error: Exception) -> None:
+        self.details_group.set_description(str(error))
+
+    def build_ui(self, volume: DockerSummary) -> None:
+        self.load_details(volume)
+        self.load_labels(volume)
+        self.load_containers()
+
+    def load_details(self, volume: DockerSummary) -> None:
+        details = {
+            "Name": self.volume_name,
+            "Driver": volume.get("Driver", "-"),
+            "Scope": volume.get("Scope", "-"),
+            "Mountpoint": volume.get("Mountpoint", "-"),
+        }
+
+        created_at = volume.get("CreatedAt")
+
+        if created_at:
+            details["Created at"] = iso_to_local(created_at)
+
+        for key, value in details.items():
+            self.details_group.add(KeyValueRow(key, value))
+
+    def load_labels(self, volume: DockerSummary) -> None:
+        labels = get_summary_labels(volume)
+
+        self.labels_group.set_visible(bool(labels))
+
+        for key, value in labels.items():
+            self.labels_group.add(KeyValueRow(key, value))
+
+    def load_containers(self) -> None:
+        names = get_container_index().get_volume_containers(self.volume_name)
+
+        self.containers_group.set_visible(bool(names))
+
+        for name in names:
+            row = ResourceRow(title=name)
+            row.connect("activated", self.on_container_row_clicked, name)
+            row.add_chevron()
+
+            self.containers_group.add(row)
+
+    def on_container_row_clicked(self, _: Gtk.ListBoxRow, name: str) -> None:
+        self.emit("container-activated", name)
@@ -0,0 +1,100 @@
+from typing import Any
+
+from gi.repository import Adw, GObject, Gtk
+
+from ..components.resource_row import ResourceRow
+from ..utils.docker import DockerSummary, build_filters, list_volumes
+from ..utils.index import ContainerIndex, get_container_index
+from ..utils.threads import run_in_background
+
+
+@Gtk.Template(resource_path="/com/scrlkx/dockery/pages/volumes_page.ui")
+class VolumesPage(Adw.NavigationPage):
+    __gtype_name__ = "VolumesPage"
+
+    __gsignals__ = {"volume-activated": (GObject.SignalFlags.RUN_FIRST, None, (str,))}
+
+    search_entry = Gtk.Template.Child()
+    dangling_row = Gtk.Template.Child()
+    label_row = Gtk.Template.Child()
+    driver_row = Gtk.Template.Child()
+    volumes_group = Gtk.Template.Child()
+    refresh_button = Gtk.Template.Child()
+
+    volume_rows: list[ResourceRow] = []
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+
+        self.volume_rows = []
+
+        self.register_events()
+        self.reload_ui()
+
+    def register_events(self) -> None:
+        self.search_entry.connect("search-changed", self.on_search_changed)
+        self.dangling_row.connect("notify::active", self.on_filters_changed)
+        self.label_row.connect("apply", self.on_filters_changed)
+        self.driver_row.connect("apply", self.on_filters_changed)
+        self.refresh_button.connect("clicked", self.on_filters_changed)
+
+    def reload_ui(self) -> None:
+        filters = build_filters(
+            dangling=self.dangling_row.get_active(),
+            label=self.label_row.get_text().strip(),
+            driver=self.driver_row.get_text().strip(),
+        )
+
+        self.refresh_button.set_sensitive(False)
+
+        run_in_background(
+            lambda: (list_volumes(filters), get_container_index(refresh=True)),
+            self.build_ui,
+            "docker_list_volumes",
+            self.on_load_failed,
+        )
+
+    def on_load_failed(self, error: Exception) -> None:
+        self.volumes_group.set_description(str(error))
+        self.refresh_button.set_sensitive(True)
+
+    def build_ui(self, result: tuple[list[DockerSummary], ContainerIndex]) -> None:
+        volumes, index = result
+
+        self.volumes_group.set_description(None)
+
+        for row in self.volume_rows:
+            self.volumes_group.remove(row)
+
+        self.volume_rows.clear()
+
+        for volume in volumes:
+            name = volume.get("Name", "")
+
+            row = ResourceRow(title=name, subtitle=volume.get("Mountpoint", ""))
+            row.connect("activated", self.on_volume_row_clicked, name)
+
+            if not index.get_volume_containers(name):
+                row.add_badge("Unused", "tag-gray")
+
+            row.add_badge(volume.get("Driver", "-"))
+            row.add_chevron()
+
+            self.volumes_group.add(row)
+            self.volume_rows.append(row)
+
+        self.on_search_changed(self.search_entry)
+        self.refresh_button.set_sensitive(True)
+
+    def on_search_changed(self, entry: Gtk.SearchEntry) -> None:
+        text = entry.get_text().lower()
+
+        for row in self.volume_rows:
+            visible = text in row.name
+            row.set_visible(visible)
+
+    def on_filters_changed(self, *_: Any) -> None:
+        self.reload_ui()
+
+    def on_volume_row_clicked(self, _: Gtk.ListBoxRow, name: str) -> None:
+        self.emit("volume-activated", name)
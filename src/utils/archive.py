@@ -0,0 +1,274 @@
+import base64
+import io
+import json
+import os
+import tarfile
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterator
+from datetime import datetime, timezone
+from stat import S_IMODE, S_ISDIR, S_ISLNK
+from typing import IO, Any, TypedDict, cast
+
+from gi.repository import GLib
+
+from .docker import get_docker_client
+
+# size of the pieces streamed from and to the daemon, the most held in memory
+CHUNK_SIZE = 1024 * 1024
+
+PROGRESS_INTERVAL_SECONDS = 0.1
+
+# tar writes each member as a header block and its data padded to whole
+# blocks, and ends the archive with two empty blocks
+TAR_BLOCK_SIZE = 512
+
+# entries listed in a directory
+MAX_ENTRIES = 500
+
+# one line per entry with its raw mode in hex, size, mtime, the raw mode of
+# what it links to (0 when nothing) and name, all from a single exec instead
+# of a stat request per entry
+LIST_SCRIPT = (
+    'cd -- "$1" || exit 1; '
+    'ls -1A | head -n "$2" | while IFS= read -r name; do '
+    'printf "%s %s %s\\n" "$(stat -c "%f %s %Y" -- "$name")" '
+    '"$(stat -L -c %f -- "$name" 2>/dev/null || echo 0)" "$name"; '
+    "done"
+)
+
+# Go's os.ModeDir and os.ModeSymlink as reported in the path stat
+MODE_DIR = 1 << 31
+MODE_SYMLINK = 1 << 27
+
+
+class PathStat(TypedDict):
+    name: str
+    size: int
+    mode: int
+    mtime: str
+    linkTarget: str
+
+
+class TransferCancelled(Exception):
+    pass
+
+
+def is_directory(stat: PathStat) -> bool:
+    return bool(stat["mode"] & MODE_DIR)
+
+
+def is_symlink(stat: PathStat) -> bool:
+    return bool(stat["mode"] & MODE_SYMLINK)
+
+
+def stat_path(container_id: str, path: str) -> PathStat:
+    api = get_docker_client().api
+
+    # the HEAD form of the archive endpoint only returns the stat header that
+    # get_archive would, without starting to stream the archive itself
+    response = api.head(
+        f"{api.base_url}/v{api.api_version}/containers/{container_id}/archive",
+        params={"path": path},
+    )
+    response.raise_for_status()
+
+    header = response.headers["X-Docker-Container-Path-Stat"]
+
+    return cast(PathStat, json.loads(base64.b64decode(header)))
+
+
+def to_file_mode(mode: int, target_mode: int) -> int:
+    # the Unix mode stat prints, as the Go file mode the path stat reports;
+    # a link to a directory keeps both bits so it can be opened like one
+    file_mode = S_IMODE(mode)
+
+    if S_ISLNK(mode):
+        file_mode |= MODE_SYMLINK
+        mode = target_mode
+
+    if S_ISDIR(mode):
+        file_mode |= MODE_DIR
+
+    return file_mode
+
+
+def parse_listing_line(line: str) -> PathStat | None:
+    parts = line.split(" ", 4)
+
+    # an entry gone between ls and stat, or a name with a line break
+    if len(parts) != 5 or not all(part.isalnum() for part in parts[:4]):
+        return None
+
+    mode, size, mtime, target_mode, name = parts
+
+    return {
+        "name": name,
+        "size": int(size),
+        "mode": to_file_mode(int(mode, 16), int(target_mode, 16)),
+        "mtime": datetime.fromtimestamp(int(mtime), timezone.utc).isoformat(),
+        "linkTarget": "",
+    }
+
+
+def list_directory(container_id: str, path: str) -> list[PathStat]:
+    # the archive API has no listing, so entries come from ls and stat inside
+    # the container, which needs it running
+    api = get_docker_client().api
+
+    command = ["sh", "-c", LIST_SCRIPT, "sh", path, str(MAX_ENTRIES)]
+    exec_id = api.exec_create(container_id, command)["Id"]
+    output = cast(bytes, api.exec_start(exec_id)).decode(errors="replace")
+
+    if api.exec_inspect(exec_id).get("ExitCode"):
+        raise OSError(output.strip())
+
+    entries = [parse_listing_line(line) for line in output.splitlines()]
+
+    return [entry for entry in entries if entry is not None]
+
+
+class Transfer:
+    # progress and cancellation shared between a copy running in a worker
+    # thread and the page showing it
+    total: int
+    done: int
+    cancelled: threading.Event
+    on_progress: Callable[[int, int], None]
+    reported_at: float
+
+    def __init__(self, total: int, on_progress: Callable[[int, int], None]) -> None:
+        self.total = total
+        self.done = 0
+        self.cancelled = threading.Event()
+        self.on_progress = on_progress
+        self.reported_at = 0
+
+    def add(self, size: int) -> None:
+        if self.cancelled.is_set():
+            raise TransferCancelled()
+
+        self.done += size
+        now = time.monotonic()
+
+        if now - self.reported_at >= PROGRESS_INTERVAL_SECONDS:
+            self.reported_at = now
+            GLib.idle_add(self.on_progress, self.done, self.total)
+
+    def cancel(self) -> None:
+        self.cancelled.set()
+
+
+class ArchiveReader(io.RawIOBase):
+    # file-like view over the archive chunks so tarfile can read the stream
+    # as it arrives
+    chunks: Iterator[bytes]
+    transfer: Transfer
+    pending: memoryview
+
+    def __init__(self, chunks: Iterator[bytes], transfer: Transfer) -> None:
+        super().__init__()
+
+        self.chunks = chunks
+        self.transfer = transfer
+        self.pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        while not self.pending:
+            chunk = next(self.chunks, None)
+
+            if chunk is None:
+                return b""
+
+            self.transfer.add(len(chunk))
+            self.pending = memoryview(chunk)
+
+        if size < 0:
+            size = len(self.pending)
+
+        data = bytes(self.pending[:size])
+        self.pending = self.pending[size:]
+
+        return data
+
+
+def download(
+    container_id: str, path: str, destination: str, transfer: Transfer
+) -> None:
+    chunks, _ = get_docker_client().api.get_archive(
+        container_id, path, chunk_size=CHUNK_SIZE
+    )
+
+    # stream mode reads each member once, front to back, and writes it out
+    # before the next one arrives
+    with tarfile.open(fileobj=ArchiveReader(chunks, transfer), mode="r|") as archive:
+        archive.extractall(destination, filter="data")
+
+
+def get_archive_size(size: int) -> int:
+    # what the daemon streams for a single file, which the progress counts
+    blocks = -(-size // TAR_BLOCK_SIZE)
+
+    return (1 + blocks + 2) * TAR_BLOCK_SIZE
+
+
+def get_local_size(path: str) -> int:
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(path)
+        for name in names
+    )
+
+
+class ArchiveWriter(io.RawIOBase):
+    # counts what tarfile writes to the packed file, so packing shows progress
+    # (and can be cancelled) before anything is sent
+    file: IO[bytes]
+    transfer: Transfer
+
+    def __init__(self, file: IO[bytes], transfer: Transfer) -> None:
+        super().__init__()
+
+        self.file = file
+        self.transfer = transfer
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        size = self.file.write(data)
+        self.transfer.add(size)
+
+        return size
+
+
+def upload(source: str, container_id: str, path: str, transfer: Transfer) -> None:
+    # the source is packed into a temporary file first, a failure while
+    # packing must not reach the daemon as a truncated archive it extracts
+    transfer.total = 2 * get_local_size(source)
+
+    with tempfile.TemporaryFile() as packed:
+        with tarfile.open(
+            fileobj=ArchiveWriter(packed, transfer), mode="w|"
+        ) as archive:
+            archive.add(source, arcname=os.path.basename(source))
+
+        # packing and sending count once each
+        size = packed.tell()
+        transfer.total = 2 * size
+        packed.seek(0)
+
+        def _read() -> Iterator[bytes]:
+            while chunk := packed.read(CHUNK_SIZE):
+                transfer.add(len(chunk))
+
+                yield chunk
+
+        get_docker_client().api.put_archive(container_id, path, _read())
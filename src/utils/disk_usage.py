@@ -0,0 +1,181 @@
+from functools import lru_cache
+from typing import Any, Iterable, TypedDict, cast
+
+from .docker import get_docker_client, get_image_tags
+
+
+class ImageUsage(TypedDict):
+    id: str
+    tags: list[str]
+    created: int
+    size: int
+    shared_size: int
+    unique_size: int
+    containers: int
+
+
+class UsageSummary(TypedDict):
+    count: int
+    active: int
+    size: int
+    reclaimable: int
+
+
+class DiskUsage(TypedDict):
+    images: list[ImageUsage]
+    layers_size: int
+    shared_size: int
+    unique_size: int
+    summaries: dict[str, UsageSummary]
+
+
+def _get_size(item: dict[str, Any], key: str) -> int:
+    value = item.get(key)
+
+    # the daemon reports -1 for sizes it did not compute
+    if isinstance(value, int) and value >= 0:
+        return value
+
+    return 0
+
+
+def _get_items(raw: dict[str, Any], key: str) -> list[dict[str, Any]]:
+    items = raw.get(key)
+
+    if not isinstance(items, Iterable):
+        return []
+
+    return cast(list[dict[str, Any]], items)
+
+
+def parse_images(raw: dict[str, Any]) -> list[ImageUsage]:
+    images: list[ImageUsage] = []
+
+    for item in _get_items(raw, "Images"):
+        size = _get_size(item, "Size")
+        shared_size = _get_size(item, "SharedSize")
+
+        images.append(
+            {
+                "id": item.get("Id", ""),
+                "tags": get_image_tags(item),
+                "created": item.get("Created", 0),
+                "size": size,
+                "shared_size": shared_size,
+                "unique_size": max(size - shared_size, 0),
+                "containers": max(item.get("Containers", 0), 0),
+            }
+        )
+
+    images.sort(key=lambda image: image["size"], reverse=True)
+
+    return images
+
+
+def summarize_images(images: list[ImageUsage], layers_size: int) -> UsageSummary:
+    used = sum(image["unique_size"] for image in images if image["containers"] > 0)
+
+    # same approximation as `docker system df`: everything but the layers
+    # unique to images in use could be reclaimed
+    return {
+        "count": len(images),
+        "active": sum(1 for image in images if image["containers"] > 0),
+        "size": layers_size,
+        "reclaimable": max(layers_size - used, 0),
+    }
+
+
+def summarize_containers(raw: dict[str, Any]) -> UsageSummary:
+    containers = _get_items(raw, "Containers")
+    running = [item for item in containers if item.get("State") == "running"]
+
+    return {
+        "count": len(containers),
+        "active": len(running),
+        "size": sum(_get_size(item, "SizeRw") for item in containers),
+        "reclaimable": sum(
+            _get_size(item, "SizeRw")
+            for item in containers
+            if item.get("State") != "running"
+        ),
+    }
+
+
+def summarize_volumes(raw: dict[str, Any]) -> UsageSummary:
+    volumes = _get_items(raw, "Volumes")
+    summary: UsageSummary = {
+        "count": len(volumes),
+        "active": 0,
+        "size": 0,
+        "reclaimable": 0,
+    }
+
+    for item in volumes:
+        usage = cast(dict[str, Any], item.get("UsageData") or {})
+        size = _get_size(usage, "Size")
+
+        summary["size"] += size
+
+        if usage.get("RefCount", 0) > 0:
+            summary["active"] += 1
+        else:
+            summary["reclaimable"] += size
+
+    return summary
+
+
+def summarize_build_cache(raw: dict[str, Any]) -> UsageSummary:
+    records = _get_items(raw, "BuildCache")
+    summary: UsageSummary = {
+        "count": len(records),
+        "active": 0,
+        "size": 0,
+        "reclaimable": 0,
+    }
+
+    for item in records:
+        size = _get_size(item, "Size")
+
+        if item.get("InUse"):
+            summary["active"] += 1
+
+        if item.get("Shared"):
+            continue
+
+        summary["size"] += size
+
+        if not item.get("InUse"):
+            summary["reclaimable"] += size
+
+    return summary
+
+
+def parse_disk_usage(raw: dict[str, Any]) -> DiskUsage:
+    images = parse_images(raw)
+    layers_size = _get_size(raw, "LayersSize")
+    unique_size = sum(image["unique_size"] for image in images)
+
+    return {
+        "images": images,
+        "layers_size": layers_size,
+        "shared_size": max(layers_size - unique_size, 0),
+        "unique_size": unique_size,
+        "summaries": {
+            "images": summarize_images(images, layers_size),
+            "containers": summarize_containers(raw),
+            "volumes": summarize_volumes(raw),
+            "build_cache": summarize_build_cache(raw),
+        },
+    }
+
+
+@lru_cache(maxsize=1)
+def _fetch_disk_usage() -> DiskUsage:
+    return parse_disk_usage(get_docker_client().df())
+
+
+def get_disk_usage(refresh: bool = False) -> DiskUsage:
+    if refresh:
+        _fetch_disk_usage.cache_clear()
+
+    return _fetch_disk_usage()
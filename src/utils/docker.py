@@ -7,12 +7,20 @@ from typing import (
     List,
     Optional,
     Protocol,
+    Tuple,
     TypedDict,
     cast,
 )
 
 from docker import from_env
 from docker.models.containers import Container
+from docker.types.daemon import CancellableStream
+from requests import Response
+
+
+class DockerTopResult(TypedDict):
+    Titles: List[str]
+    Processes: List[List[str]]
 
 
 class ContainerCollectionProto(Protocol):
@@ -27,7 +35,82 @@ class ContainerCollectionProto(Protocol):
     def get(self, container_id: str) -> Container: ...
 
 
+class APIClientProto(Protocol):
+    def containers(
+        self,
+        quiet: bool = False,
+        # pylint: disable=redefined-builtin
+        all: bool = False,
+        *,
+        size: bool = False,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]: ...
+    def images(
+        self,
+        name: Optional[str] = None,
+        quiet: bool = False,
+        # pylint: disable=redefined-builtin
+        all: bool = False,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]: ...
+    def volumes(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]: ...
+    def networks(
+        self,
+        names: Optional[List[str]] = None,
+        ids: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]: ...
+    def inspect_image(self, image: str) -> Dict[str, Any]: ...
+    def inspect_volume(self, name: str) -> Dict[str, Any]: ...
+    def inspect_network(self, net_id: str) -> Dict[str, Any]: ...
+    def stats(
+        self,
+        container: str,
+        decode: Optional[bool] = None,
+        stream: bool = True,
+        one_shot: Optional[bool] = None,
+    ) -> Any: ...
+    def top(self, container: str, ps_args: Optional[str] = None) -> DockerTopResult: ...
+    def exec_create(
+        self,
+        container: str,
+        cmd: str | List[str],
+        *,
+        stdin: bool = False,
+        tty: bool = False,
+    ) -> Dict[str, Any]: ...
+    def exec_start(
+        self, exec_id: str, *, tty: bool = False, socket: bool = False
+    ) -> Any: ...
+    def exec_resize(
+        self, exec_id: str, height: Optional[int] = None, width: Optional[int] = None
+    ) -> None: ...
+    def exec_inspect(self, exec_id: str) -> Dict[str, Any]: ...
+    def get_archive(
+        self, container: str, path: str, chunk_size: int = ...
+    ) -> Tuple[Iterator[bytes], Optional[Dict[str, Any]]]: ...
+    def put_archive(self, container: str, path: str, data: Any) -> bool: ...
+    def head(
+        self, url: str, *, params: Optional[Dict[str, str]] = None
+    ) -> Response: ...
+    def post(
+        self,
+        url: str,
+        *,
+        params: Optional[Dict[str, str]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+    ) -> Response: ...
+    @property
+    def base_url(self) -> str: ...
+    @property
+    def api_version(self) -> str: ...
+
+
 class DockerClientProto(Protocol):
+    @property
+    def api(self) -> APIClientProto: ...
+
     @property
     def containers(self) -> ContainerCollectionProto: ...
 
@@ -37,7 +120,9 @@ class DockerClientProto(Protocol):
         until: Optional[int] = None,
         filters: Optional[Dict[str, Any]] = None,
         decode: bool = False,
-    ) -> Iterator[Dict[str, Any]]: ...
+    ) -> "CancellableStream[Dict[str, Any]]": ...
+
+    def df(self) -> Dict[str, Any]: ...
 
 
 class DockerNetworkInfo(TypedDict, total=False):
@@ -49,6 +134,8 @@ class DockerNetworkInfo(TypedDict, total=False):
 
 DockerMount = dict[str, str]
 
+DockerSummary = dict[str, Any]
+
 
 class DockerPortBinding(TypedDict, total=False):
     HostIp: str
@@ -122,6 +209,15 @@ def get_container_restart_policy(container: Container) -> str:
     return policy.get("Name", "no")
 
 
+def get_container_health(container: Container) -> dict[str, Any] | None:
+    health = get_container_attribute(container, "State.Health")
+
+    if not isinstance(health, dict):
+        return None
+
+    return cast(dict[str, Any], health)
+
+
 def get_container_environment_variables(
     container: Container,
 ) -> dict[str, str]:
@@ -144,6 +240,15 @@ def get_container_environment_variables(
     return variables
 
 
+def get_container_labels(container: Container) -> dict[str, str]:
+    labels = get_container_attribute(container, "Config.Labels", {})
+
+    if not isinstance(labels, dict):
+        return {}
+
+    return cast(dict[str, str], labels)
+
+
 def get_container_networks(
     container: Container,
 ) -> dict[str, str]:
@@ -206,20 +311,56 @@ def get_container(name: str) -> Container:
     return get_docker_client().containers.get(name)
 
 
-def get_containers() -> list[Container]:
-    status_order = {
-        "running": 0,
-        "paused": 1,
-        "restarting": 2,
-        "created": 3,
-        "exited": 4,
-        "dead": 5,
-    }
+STATUS_ORDER = {
+    "running": 0,
+    "paused": 1,
+    "restarting": 2,
+    "created": 3,
+    "exited": 4,
+    "dead": 5,
+}
+
+
+def get_container_status_rank(container: Container) -> int:
+    return STATUS_ORDER.get(container.status, 99)
+
+
+def get_container_restart_count(container: Container) -> int:
+    return get_container_attribute(container, "RestartCount", 0)
+
+
+def get_container_reserved_cpus(container: Container) -> int:
+    # in billionths of a CPU, like the daemon's NanoCpus
+    nano_cpus = get_container_attribute(container, "HostConfig.NanoCpus") or 0
+
+    if nano_cpus:
+        return nano_cpus
+
+    quota = get_container_attribute(container, "HostConfig.CpuQuota") or 0
+    period = get_container_attribute(container, "HostConfig.CpuPeriod") or 0
+
+    if quota > 0 and period > 0:
+        return quota * 1_000_000_000 // period
+
+    return 0
+
+
+def get_container_reserved_memory(container: Container) -> int:
+    return (
+        get_container_attribute(container, "HostConfig.MemoryReservation")
+        or get_container_attribute(container, "HostConfig.Memory")
+        or 0
+    )
 
-    containers = get_docker_client().containers.list(all=True)
-    containers.sort(key=lambda item: status_order.get(item.status, 99))
 
-    return containers
+def get_containers(ids: list[str] | None = None) -> list[Container]:
+    # ordering is left to the caller's sort model
+    filters = {"id": ids} if ids is not None else None
+
+    # ignore_removed skips containers destroyed while listing
+    return get_docker_client().containers.list(
+        all=True, filters=filters, ignore_removed=True
+    )
 
 
 def start_container(name: str) -> None:
@@ -253,12 +394,12 @@ def remove_container(name: str) -> None:
 
 def get_container_actions(container: Container) -> list[str]:
     actions = {
-        "running": ["stop", "pause", "restart", "kill"],
+        "running": ["stop", "pause", "restart", "kill", "terminal", "files"],
         "restarting": ["stop", "kill"],
-        "paused": ["resume", "stop", "kill"],
-        "stopped": ["start", "remove"],
-        "exited": ["start", "remove"],
-        "created": ["start", "remove"],
+        "paused": ["resume", "stop", "kill", "files"],
+        "stopped": ["start", "remove", "files"],
+        "exited": ["start", "remove", "files"],
+        "created": ["start", "remove", "files"],
     }
 
     return actions.get(container.status, ["start", "stop"])
@@ -268,3 +409,90 @@ def get_container_next_action(container: Container) -> str:
     actions = get_container_actions(container)
 
     return actions[0]
+
+
+def build_filters(
+    dangling: bool = False, label: str = "", driver: str = ""
+) -> dict[str, list[str]]:
+    filters: dict[str, list[str]] = {}
+
+    if dangling:
+        filters["dangling"] = ["true"]
+
+    if label:
+        filters["label"] = [label]
+
+    if driver:
+        filters["driver"] = [driver]
+
+    return filters
+
+
+def list_container_summaries(
+    filters: dict[str, list[str]] | None = None,
+) -> list[DockerSummary]:
+    api = get_docker_client().api
+
+    return api.containers(all=True, filters=filters)
+
+
+def list_images(filters: dict[str, list[str]] | None = None) -> list[DockerSummary]:
+    api = get_docker_client().api
+
+    return api.images(filters=filters)
+
+
+def list_volumes(filters: dict[str, list[str]] | None = None) -> list[DockerSummary]:
+    api = get_docker_client().api
+    volumes = api.volumes(filters=filters).get("Volumes")
+
+    return cast(list[DockerSummary], volumes or [])
+
+
+def list_networks(filters: dict[str, list[str]] | None = None) -> list[DockerSummary]:
+    api = get_docker_client().api
+
+    return api.networks(filters=filters)
+
+
+def inspect_image(image_id: str) -> DockerSummary:
+    return get_docker_client().api.inspect_image(image_id)
+
+
+def inspect_volume(name: str) -> DockerSummary:
+    return get_docker_client().api.inspect_volume(name)
+
+
+def inspect_network(network_id: str) -> DockerSummary:
+    return get_docker_client().api.inspect_network(network_id)
+
+
+def get_summary_attribute(
+    summary: DockerSummary, attribute: str, default: Any | None = None
+) -> Any:
+    current: Any = summary
+
+    try:
+        for key in attribute.split("."):
+            current = current[key]
+
+        return current
+    except (KeyError, TypeError):
+        return default
+
+
+def get_summary_labels(
+    summary: DockerSummary, attribute: str = "Labels"
+) -> dict[str, str]:
+    labels = get_summary_attribute(summary, attribute)
+
+    if not isinstance(labels, dict):
+        return {}
+
+    return cast(dict[str, str], labels)
+
+
+def get_image_tags(summary: DockerSummary) -> list[str]:
+    tags = cast(list[str], summary.get("RepoTags") or [])
+
+    return [tag for tag in tags if tag != "<none>:<none>"]
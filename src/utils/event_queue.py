@@ -0,0 +1,105 @@
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+
+from gi.repository import GLib
+
+from .events import DockerEvent, get_event_action, get_event_container_id
+
+# pending containers kept before the oldest ones are dropped
+MAX_PENDING = 1000
+# events handed to the UI per main loop iteration
+BATCH_SIZE = 200
+
+logger = logging.getLogger(__name__)
+
+EventBatchHandler = Callable[[list[DockerEvent]], None]
+
+
+def get_merge_key(event: DockerEvent) -> tuple[str, str]:
+    kind = "health" if get_event_action(event) == "health_status" else "state"
+
+    return (get_event_container_id(event), kind)
+
+
+class EventQueue:
+    # bounded queue between the event reader thread and the main loop where a
+    # newer event for a container replaces the one still pending, so a storm
+    # costs at most one update per container and BATCH_SIZE per iteration
+    on_batch: EventBatchHandler
+    on_overflow: Callable[[], None]
+    pending: OrderedDict[tuple[str, str], DockerEvent]
+    lock: threading.Lock
+    scheduled: bool
+    overflowed: bool
+    stats: dict[str, int]
+
+    def __init__(
+        self, on_batch: EventBatchHandler, on_overflow: Callable[[], None]
+    ) -> None:
+        self.on_batch = on_batch
+        self.on_overflow = on_overflow
+        self.pending = OrderedDict()
+        self.lock = threading.Lock()
+        self.scheduled = False
+        self.overflowed = False
+        self.stats = {"received": 0, "merged": 0, "dropped": 0}
+
+    def put(self, event: DockerEvent) -> None:
+        key = get_merge_key(event)
+
+        with self.lock:
+            self.stats["received"] += 1
+
+            if key in self.pending:
+                self.stats["merged"] += 1
+            elif len(self.pending) >= MAX_PENDING:
+                self.pending.popitem(last=False)
+                self.stats["dropped"] += 1
+                self.overflowed = True
+
+            self.pending[key] = event
+
+            if self.scheduled:
+                return
+
+            self.scheduled = True
+
+        GLib.idle_add(self._drain)
+
+    def _drain(self) -> bool:
+        with self.lock:
+            count = min(BATCH_SIZE, len(self.pending))
+            batch = [self.pending.popitem(last=False)[1] for _ in range(count)]
+
+            overflowed = self.overflowed and not self.pending
+            done = not self.pending
+
+            if overflowed:
+                self.overflowed = False
+
+            if done:
+                self.scheduled = False
+
+        # the source has to stay in place while events are pending, since
+        # put only schedules a drain when none is
+        try:
+            self.on_batch(batch)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Container event batch failed")
+
+        # dropped events are recovered with a full resync once caught up
+        if overflowed:
+            logger.warning("Event queue overflowed, resyncing: %s", self.get_stats())
+
+            try:
+                self.on_overflow()
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Container event resync failed")
+
+        return not done
+
+    def get_stats(self) -> dict[str, int]:
+        with self.lock:
+            return {**self.stats, "pending": len(self.pending)}
@@ -1,12 +1,38 @@
+import logging
 import threading
+import time
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Any, TypedDict, cast
 
-from docker.models.containers import Container
-from gi.repository import GLib
+from docker.errors import DockerException
+from requests.exceptions import RequestException
 
 from .docker import get_docker_client
 
+RECONNECT_DELAY_SECONDS = 5
+
+logger = logging.getLogger(__name__)
+
+# actions that change the state of a container
+STATE_ACTIONS = [
+    "start",
+    "stop",
+    "die",
+    "pause",
+    "unpause",
+    "restart",
+    "destroy",
+]
+
+CONTAINER_ACTIONS = [
+    *STATE_ACTIONS,
+    "create",
+    "kill",
+    "oom",
+    "health_status",
+]
+
 
 class DockerEvent(TypedDict, total=False):
     Type: str
@@ -18,66 +44,99 @@ class DockerEvent(TypedDict, total=False):
     Actor: dict[str, Any]
 
 
-def on_containers_change(on_change: Callable[[], None]):
-    client = get_docker_client()
+ContainerEventListener = Callable[[DockerEvent], None]
 
-    def _listen() -> None:
-        for (
-            _
-        ) in client.events(  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
-            decode=True,
-            filters={
-                "type": "container",
-                "event": [
-                    "start",
-                    "stop",
-                    "die",
-                    "pause",
-                    "unpause",
-                    "restart",
-                    "destroy",
-                ],
-            },
-        ):
-            GLib.idle_add(on_change)
-
-    thread = threading.Thread(
-        target=_listen,
-        name="docker_on_containers_chage",
-        daemon=True,
-    )
-
-    thread.start()
-
-
-def on_container_change(on_change: Callable[[], None], container: Container):
-    client = get_docker_client()
-
-    def _listen():
-        for _event in client.events(
+
+def get_event_action(event: DockerEvent) -> str:
+    # health events come as "health_status: healthy"
+    action, _, _ = event.get("Action", "").partition(":")
+
+    return action
+
+
+def get_event_container_id(event: DockerEvent) -> str:
+    return event.get("Actor", {}).get("ID", "")
+
+
+def get_event_attributes(event: DockerEvent) -> dict[str, str]:
+    return event.get("Actor", {}).get("Attributes", {})
+
+
+class ContainerEventStream:
+    listeners: list[ContainerEventListener]
+    lock: threading.Lock
+    thread: threading.Thread | None
+    last_time_nano: int
+
+    def __init__(self) -> None:
+        self.listeners = []
+        self.lock = threading.Lock()
+        self.thread = None
+        self.last_time_nano = 0
+
+    def add_listener(self, listener: ContainerEventListener) -> None:
+        with self.lock:
+            self.listeners.append(listener)
+
+        self.start()
+
+    def remove_listener(self, listener: ContainerEventListener) -> None:
+        with self.lock:
+            if listener in self.listeners:
+                self.listeners.remove(listener)
+
+    def start(self) -> None:
+        with self.lock:
+            if self.thread is not None:
+                return
+
+            self.thread = threading.Thread(
+                target=self._listen,
+                name="docker_container_events",
+                daemon=True,
+            )
+
+        self.thread.start()
+
+    def _listen(self) -> None:
+        while True:
+            try:
+                self._read()
+            except (DockerException, RequestException):
+                pass
+
+            time.sleep(RECONNECT_DELAY_SECONDS)
+
+    def _read(self) -> None:
+        since = self.last_time_nano // 1_000_000_000 or None
+
+        # after a reconnect the daemon replays events since the last one seen
+        events = get_docker_client().events(
+            since=since,
             decode=True,
-            filters={
-                "type": "container",
-                "event": [
-                    "start",
-                    "stop",
-                    "die",
-                    "pause",
-                    "unpause",
-                    "restart",
-                    "destroy",
-                ],
-            },
-        ):
+            filters={"type": "container", "event": CONTAINER_ACTIONS},
+        )
+
+        for _event in events:
             event = cast(DockerEvent, _event)
+            time_nano = event.get("timeNano", 0)
+
+            if time_nano and time_nano <= self.last_time_nano:
+                continue
+
+            self.last_time_nano = time_nano or self.last_time_nano
+
+            with self.lock:
+                listeners = list(self.listeners)
 
-            if container.id == event.get("Actor", {}).get("ID"):
-                GLib.idle_add(on_change)
+            for listener in listeners:
+                # a failing listener must not end the stream for the others
+                try:
+                    listener(event)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    logger.exception("Container event listener failed")
 
-    thread = threading.Thread(
-        target=_listen,
-        name="docker_on_container_chage",
-        daemon=True,
-    )
 
-    thread.start()
+@lru_cache(maxsize=1)
+def get_container_events() -> ContainerEventStream:
+    return ContainerEventStream()
@@ -0,0 +1,168 @@
+import socket
+import ssl
+from collections.abc import Callable
+
+from docker.errors import DockerException
+from gi.repository import GLib
+
+from .docker import get_docker_client
+from .threads import run_in_background
+
+# prefer bash when the image ships it
+SHELL_COMMAND = [
+    "/bin/sh",
+    "-c",
+    "export TERM=xterm-256color; "
+    "if command -v bash >/dev/null 2>&1; then exec bash; else exec sh; fi",
+]
+
+CHUNK_SIZE = 64 * 1024
+
+# output handled per main loop iteration, so a flood of output (cat on a big
+# file) still leaves room for input and redraws in between
+MAX_READ_PER_DISPATCH = 1024 * 1024
+
+READ_CONDITIONS = GLib.IOCondition.IN | GLib.IOCondition.HUP | GLib.IOCondition.ERR
+
+
+def create_exec(container_id: str) -> tuple[str, socket.socket]:
+    api = get_docker_client().api
+
+    exec_id = api.exec_create(
+        container_id,
+        SHELL_COMMAND,
+        stdin=True,
+        tty=True,
+    )["Id"]
+
+    # the hijacked HTTP connection, wrapped in a SocketIO on unix sockets
+    raw = api.exec_start(exec_id, tty=True, socket=True)
+    sock: socket.socket = getattr(raw, "_sock", raw)
+    sock.setblocking(False)
+
+    return (exec_id, sock)
+
+
+class ExecSession:
+    # reads and writes the exec socket from the main loop through fd watches,
+    # so no thread sits on the connection
+    exec_id: str
+    sock: socket.socket
+    on_output: Callable[[bytes], None]
+    on_exit: Callable[[int | None], None]
+    pending: bytearray
+    read_source_id: int
+    write_source_id: int
+
+    def __init__(
+        self,
+        exec_id: str,
+        sock: socket.socket,
+        on_output: Callable[[bytes], None],
+        on_exit: Callable[[int | None], None],
+    ) -> None:
+        self.exec_id = exec_id
+        self.sock = sock
+        self.on_output = on_output
+        self.on_exit = on_exit
+        self.pending = bytearray()
+        self.write_source_id = 0
+
+        self.read_source_id = GLib.unix_fd_add_full(
+            GLib.PRIORITY_DEFAULT,
+            sock.fileno(),
+            READ_CONDITIONS,
+            self._on_readable,
+        )
+
+    def _on_readable(self, *_: object) -> bool:
+        received = 0
+
+        while received < MAX_READ_PER_DISPATCH:
+            try:
+                data = self.sock.recv(CHUNK_SIZE)
+            except (BlockingIOError, ssl.SSLWantReadError):
+                return True
+            except OSError:
+                data = b""
+
+            if not data:
+                self.read_source_id = 0
+                self._finish()
+                return False
+
+            self.on_output(data)
+            received += len(data)
+
+        return True
+
+    def write(self, data: bytes) -> None:
+        self.pending += data
+
+        if not self.write_source_id:
+            self._flush()
+
+    def _flush(self, *_: object) -> bool:
+        try:
+            sent = self.sock.send(self.pending)
+        except (BlockingIOError, ssl.SSLWantWriteError):
+            sent = 0
+        except OSError:
+            self.pending.clear()
+            sent = 0
+
+        del self.pending[:sent]
+
+        if not self.pending:
+            self.write_source_id = 0
+            return False
+
+        # the socket is full, wait until it drains
+        if not self.write_source_id:
+            self.write_source_id = GLib.unix_fd_add_full(
+                GLib.PRIORITY_DEFAULT,
+                self.sock.fileno(),
+                GLib.IOCondition.OUT,
+                self._flush,
+            )
+
+        return True
+
+    def resize(self, columns: int, rows: int) -> None:
+        exec_id = self.exec_id
+
+        def _resize() -> None:
+            try:
+                get_docker_client().api.exec_resize(exec_id, height=rows, width=columns)
+            except DockerException:
+                pass
+
+        run_in_background(_resize, lambda _: None, "docker_exec_resize")
+
+    def _finish(self) -> None:
+        exec_id = self.exec_id
+
+        def _get_exit_code() -> int | None:
+            try:
+                return get_docker_client().api.exec_inspect(exec_id).get("ExitCode")
+            except DockerException:
+                return None
+
+        self.close()
+
+        run_in_background(
+            _get_exit_code,
+            self.on_exit,
+            "docker_exec_inspect",
+            lambda _: self.on_exit(None),
+        )
+
+    def close(self) -> None:
+        for source_id in (self.read_source_id, self.write_source_id):
+            if source_id:
+                GLib.source_remove(source_id)
+
+        self.read_source_id = 0
+        self.write_source_id = 0
+
+        self.sock.close()
@@ -0,0 +1,176 @@
+import json
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from functools import lru_cache
+
+from gi.repository import GLib
+
+from .events import (
+    DockerEvent,
+    get_container_events,
+    get_event_action,
+    get_event_attributes,
+    get_event_container_id,
+)
+from .history import get_event_history
+
+# a container is flapping when it crashed this many times within the window
+CRASH_THRESHOLD = 3
+CRASH_WINDOW_SECONDS = 5 * 60
+
+# exit codes of a container that was asked to stop, 143 being SIGTERM
+CLEAN_EXIT_CODES = ["0", "143"]
+
+FLAPPING_ACTIONS = ["kill", "stop", "die", "start"]
+
+# called with the container's ID, name and whether it is flapping now
+FlappingListener = Callable[[str, str, bool], None]
+
+
+class FlappingDetector:
+    # only the last CRASH_THRESHOLD crashes are kept per container, so each
+    # event is O(1) and a container is flapping while the oldest of them is
+    # still inside the window; a timer per flapping container notices when
+    # it leaves the window without another event
+    crashes: dict[str, deque[float]]
+    # containers told to stop by a kill or stop, their next die is no crash
+    stopping: set[str]
+    flapping: set[str]
+    names: dict[str, str]
+    listeners: list[FlappingListener]
+    lock: threading.Lock
+    started: bool
+
+    def __init__(self) -> None:
+        self.crashes = {}
+        self.stopping = set()
+        self.flapping = set()
+        self.names = {}
+        self.listeners = []
+        self.lock = threading.Lock()
+        self.started = False
+
+    def start(self) -> None:
+        if self.started:
+            return
+
+        self.started = True
+
+        since_nano = int((time.time() - CRASH_WINDOW_SECONDS) * 1_000_000_000)
+        recent = get_event_history().get_recent_actions(FLAPPING_ACTIONS, since_nano)
+
+        for container_id, name, action, detail, time_nano in recent:
+            attributes = {**json.loads(detail), "name": name}
+            event: DockerEvent = {
+                "Action": action,
+                "timeNano": time_nano,
+                "Actor": {"ID": container_id, "Attributes": attributes},
+            }
+
+            self.record(event, notify=False)
+
+        get_container_events().add_listener(self.record)
+
+    def add_listener(self, listener: FlappingListener) -> None:
+        with self.lock:
+            self.listeners.append(listener)
+
+    def record(self, event: DockerEvent, notify: bool = True) -> None:
+        action = get_event_action(event)
+        container_id = get_event_container_id(event)
+        attributes = get_event_attributes(event)
+
+        with self.lock:
+            stopping = container_id in self.stopping
+
+            if action == "destroy":
+                self.crashes.pop(container_id, None)
+                self.flapping.discard(container_id)
+                self.names.pop(container_id, None)
+
+            if action in ("kill", "stop"):
+                self.stopping.add(container_id)
+            else:
+                self.stopping.discard(container_id)
+
+        if action != "die":
+            return
+
+        # a user's stop, kill or restart is no crash, nor is a clean exit
+        if stopping or attributes.get("exitCode", "") in CLEAN_EXIT_CODES:
+            return
+
+        name = attributes.get("name", "")
+        when = event.get("timeNano", 0) / 1_000_000_000 or time.time()
+
+        self.add_crash(container_id, name, when, notify)
+
+    def add_crash(
+        self, container_id: str, name: str, when: float, notify: bool = True
+    ) -> None:
+        with self.lock:
+            crashes = self.crashes.setdefault(
+                container_id, deque(maxlen=CRASH_THRESHOLD)
+            )
+            crashes.append(when)
+
+            self.names[container_id] = name
+
+            started_flapping = container_id not in self.flapping and self._is_flapping(
+                container_id, when
+            )
+
+            if started_flapping:
+                self.flapping.add(container_id)
+                self._schedule_expiry(container_id)
+
+            listeners = list(self.listeners)
+
+        if notify and started_flapping:
+            for listener in listeners:
+                listener(container_id, name, True)
+
+    def _schedule_expiry(self, container_id: str) -> None:
+        expires_at = self.crashes[container_id][0] + CRASH_WINDOW_SECONDS
+        delay = max(expires_at - time.time(), 0)
+
+        GLib.timeout_add(int(delay * 1000) + 1, self._expire, container_id)
+
+    def _expire(self, container_id: str) -> bool:
+        with self.lock:
+            if container_id not in self.flapping:
+                return False
+
+            # newer crashes moved the window on
+            if self._is_flapping(container_id, time.time()):
+                self._schedule_expiry(container_id)
+                return False
+
+            self.flapping.discard(container_id)
+
+            name = self.names.get(container_id, "")
+            listeners = list(self.listeners)
+
+        for listener in listeners:
+            listener(container_id, name, False)
+
+        return False
+
+    def _is_flapping(self, container_id: str, now: float) -> bool:
+        crashes = self.crashes.get(container_id)
+
+        if not crashes or len(crashes) < CRASH_THRESHOLD:
+            return False
+
+        return now - crashes[0] <= CRASH_WINDOW_SECONDS
+
+    def is_flapping(self, container_id: str) -> bool:
+        with self.lock:
+            return self._is_flapping(container_id, time.time())
+
+
+@lru_cache(maxsize=1)
+def get_flapping_detector() -> FlappingDetector:
+    return FlappingDetector()
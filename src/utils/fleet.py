@@ -0,0 +1,123 @@
+from typing import TypedDict
+
+from .docker import (
+    get_container_labels,
+    get_container_reserved_cpus,
+    get_container_reserved_memory,
+)
+from .sorting import ContainerItem
+
+COMPOSE_PROJECT_LABEL = "com.docker.compose.project"
+
+
+class Facet(TypedDict):
+    key: str
+    title: str
+
+
+FACETS: list[Facet] = [
+    {"key": "status", "title": "Status"},
+    {"key": "project", "title": "Compose Projects"},
+    {"key": "image", "title": "Images"},
+]
+
+FacetValue = tuple[str, str]
+
+
+class FleetEntry(TypedDict):
+    facets: list[FacetValue]
+    cpus: int
+    memory: int
+
+
+def get_item_facets(item: ContainerItem) -> list[FacetValue]:
+    facets = [("status", item.container.status)]
+
+    project = get_container_labels(item.container).get(COMPOSE_PROJECT_LABEL)
+
+    if project:
+        facets.append(("project", project))
+
+    # resolved off the main thread when the item was built
+    if item.image:
+        facets.append(("image", item.image))
+
+    return facets
+
+
+def build_entry(item: ContainerItem) -> FleetEntry:
+    container = item.container
+    running = container.status == "running"
+
+    # reservations only hold resources while the container runs
+    return {
+        "facets": get_item_facets(item),
+        "cpus": get_container_reserved_cpus(container) if running else 0,
+        "memory": get_container_reserved_memory(container) if running else 0,
+    }
+
+
+class FleetOverview:
+    # aggregates kept per container, so a change only moves that
+    # container's contribution instead of recounting the whole list
+    entries: dict[str, FleetEntry]
+    members: dict[FacetValue, set[str]]
+    cpus: int
+    memory: int
+
+    def __init__(self) -> None:
+        self.entries = {}
+        self.members = {}
+        self.cpus = 0
+        self.memory = 0
+
+    def reset(self, items: list[ContainerItem]) -> None:
+        self.entries.clear()
+        self.members.clear()
+        self.cpus = 0
+        self.memory = 0
+
+        for item in items:
+            self.update(item.container_id, item)
+
+    def update(self, container_id: str, item: ContainerItem | None) -> set[FacetValue]:
+        # returns the facet values whose counts changed
+        changed: set[FacetValue] = set()
+        old = self.entries.pop(container_id, None)
+
+        if old is not None:
+            self.cpus -= old["cpus"]
+            self.memory -= old["memory"]
+
+            for facet in old["facets"]:
+                members = self.members[facet]
+                members.discard(container_id)
+
+                if not members:
+                    del self.members[facet]
+
+                changed.add(facet)
+
+        if item is not None:
+            new = build_entry(item)
+
+            self.entries[container_id] = new
+            self.cpus += new["cpus"]
+            self.memory += new["memory"]
+
+            for facet in new["facets"]:
+                self.members.setdefault(facet, set()).add(container_id)
+
+                # a container staying in a value leaves its count alone
+                if facet in changed:
+                    changed.discard(facet)
+                else:
+                    changed.add(facet)
+
+        return changed
+
+    def get_count(self, facet: FacetValue) -> int:
+        return len(self.members.get(facet, ()))
+
+    def has_container(self, facet: FacetValue, container_id: str) -> bool:
+        return container_id in self.members.get(facet, ())
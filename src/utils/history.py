@@ -0,0 +1,268 @@
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from functools import lru_cache
+from typing import TypedDict
+
+from gi.repository import GLib, Gtk
+
+from .events import (
+    DockerEvent,
+    get_container_events,
+    get_event_action,
+    get_event_attributes,
+    get_event_container_id,
+)
+from .lifecycle import PageScheduler
+
+logger = logging.getLogger(__name__)
+
+# retention cap, whichever is hit first
+MAX_EVENTS = 200_000
+MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+
+BATCH_SIZE = 500
+BATCH_INTERVAL_SECONDS = 0.5
+
+# rows waiting for the writer before new ones are dropped
+MAX_PENDING = 10 * BATCH_SIZE
+
+# attributes worth keeping for the timeline, the rest are container labels
+KEPT_ATTRIBUTES = ["exitCode", "signal"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    container_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    action TEXT NOT NULL,
+    detail TEXT NOT NULL,
+    time_nano INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_container_time
+    ON events (container_id, time_nano);
+CREATE INDEX IF NOT EXISTS events_action_time
+    ON events (action, time_nano);
+CREATE INDEX IF NOT EXISTS events_time
+    ON events (time_nano);
+"""
+
+
+class HistoryEntry(TypedDict):
+    action: str
+    detail: dict[str, str]
+    time_nano: int
+
+
+HistoryRow = tuple[str, str, str, str, int]
+
+HistoryListener = Callable[[set[str]], None]
+
+
+def get_history_path() -> str:
+    return os.path.join(GLib.get_user_data_dir(), "dockery", "events.sqlite3")
+
+
+def to_history_row(event: DockerEvent) -> HistoryRow:
+    action = get_event_action(event)
+    attributes = get_event_attributes(event)
+
+    detail = {key: attributes[key] for key in KEPT_ATTRIBUTES if key in attributes}
+
+    if action == "health_status":
+        detail["status"] = event.get("Action", "").partition(":")[2].strip()
+
+    time_nano = event.get("timeNano") or event.get("time", 0) * 1_000_000_000
+
+    return (
+        get_event_container_id(event),
+        attributes.get("name", ""),
+        action,
+        json.dumps(detail),
+        time_nano,
+    )
+
+
+class EventHistory:
+    path: str
+    pending: "queue.Queue[HistoryRow]"
+    listeners: list[HistoryListener]
+    lock: threading.Lock
+    thread: threading.Thread | None
+    connection: sqlite3.Connection | None
+    overflowed: bool
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.pending = queue.Queue(MAX_PENDING)
+        self.listeners = []
+        self.lock = threading.Lock()
+        self.thread = None
+        self.connection = None
+        self.overflowed = False
+
+    def start(self) -> None:
+        if self.thread is not None:
+            return
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        self.thread = threading.Thread(
+            target=self._write,
+            name="dockery_event_history",
+            daemon=True,
+        )
+
+        self.thread.start()
+
+        get_container_events().add_listener(self.record)
+
+    def record(self, event: DockerEvent) -> None:
+        if not get_event_container_id(event):
+            return
+
+        try:
+            self.pending.put_nowait(to_history_row(event))
+            self.overflowed = False
+        except queue.Full:
+            # the writer is stuck, the timeline misses events until it
+            # catches up; logged once per stretch
+            if not self.overflowed:
+                logger.warning("Event history queue is full, dropping events")
+
+            self.overflowed = True
+
+    def add_listener(self, listener: HistoryListener) -> None:
+        with self.lock:
+            self.listeners.append(listener)
+
+    def remove_listener(self, listener: HistoryListener) -> None:
+        with self.lock:
+            if listener in self.listeners:
+                self.listeners.remove(listener)
+
+    def _write(self) -> None:
+        try:
+            connection = sqlite3.connect(self.path)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(SCHEMA)
+        except sqlite3.Error:
+            logger.exception("Could not open the event history")
+            get_container_events().remove_listener(self.record)
+            return
+
+        while True:
+            batch = [self.pending.get()]
+            deadline = time.monotonic() + BATCH_INTERVAL_SECONDS
+
+            # gather whatever else arrives shortly after, up to one batch
+            while len(batch) < BATCH_SIZE:
+                timeout = deadline - time.monotonic()
+
+                if timeout <= 0:
+                    break
+
+                try:
+                    batch.append(self.pending.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            # a failed batch (disk full, locked database) is lost, the
+            # next one may well get through
+            try:
+                with connection:
+                    connection.executemany(
+                        "INSERT INTO events"
+                        " (container_id, name, action, detail, time_nano)"
+                        " VALUES (?, ?, ?, ?, ?)",
+                        batch,
+                    )
+                    self._prune(connection)
+            except sqlite3.Error:
+                logger.exception("Could not write %d history events", len(batch))
+                continue
+
+            with self.lock:
+                listeners = list(self.listeners)
+
+            container_ids = {row[0] for row in batch}
+
+            for listener in listeners:
+                listener(container_ids)
+
+    def _prune(self, connection: sqlite3.Connection) -> None:
+        oldest = (time.time() - MAX_AGE_SECONDS) * 1_000_000_000
+
+        connection.execute("DELETE FROM events WHERE time_nano < ?", (oldest,))
+        connection.execute(
+            "DELETE FROM events WHERE id <= (SELECT MAX(id) FROM events) - ?",
+            (MAX_EVENTS,),
+        )
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self.connection is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+            self.connection = sqlite3.connect(self.path)
+            self.connection.executescript(SCHEMA)
+
+        return self.connection
+
+    def get_timeline(self, container_id: str, limit: int = 50) -> list[HistoryEntry]:
+        rows = self._get_connection().execute(
+            "SELECT action, detail, time_nano FROM events"
+            " WHERE container_id = ? ORDER BY time_nano DESC LIMIT ?",
+            (container_id, limit),
+        )
+
+        return [
+            {"action": action, "detail": json.loads(detail), "time_nano": time_nano}
+            for action, detail, time_nano in rows
+        ]
+
+    def get_recent_actions(
+        self, actions: list[str], since_nano: int
+    ) -> list[HistoryRow]:
+        placeholders = ",".join("?" * len(actions))
+
+        rows = self._get_connection().execute(
+            "SELECT container_id, name, action, detail, time_nano FROM events"
+            f" WHERE action IN ({placeholders}) AND time_nano >= ?"
+            " ORDER BY time_nano",
+            (*actions, since_nano),
+        )
+
+        return list(rows)
+
+    def count_actions(self, container_id: str, since_nano: int) -> dict[str, int]:
+        rows = self._get_connection().execute(
+            "SELECT action, COUNT(*) FROM events"
+            " WHERE container_id = ? AND time_nano >= ? GROUP BY action",
+            (container_id, since_nano),
+        )
+
+        return dict(rows)
+
+
+@lru_cache(maxsize=1)
+def get_event_history() -> EventHistory:
+    return EventHistory(get_history_path())
+
+
+def on_history_change(
+    on_change: Callable[[], None], container_id: str, page: Gtk.Widget
+) -> None:
+    history = get_event_history()
+    scheduler = PageScheduler(page, on_change)
+
+    def _on_write(container_ids: set[str]) -> None:
+        if container_id in container_ids:
+            GLib.idle_add(scheduler.request)
+
+    history.add_listener(_on_write)
+    scheduler.add_close_callback(lambda: history.remove_listener(_on_write))
@@ -0,0 +1,33 @@
+from functools import lru_cache
+
+from gi.repository import Gdk, GdkPixbuf, GLib, Gtk
+
+ICONS_PATH = "/com/scrlkx/dockery/icons"
+
+# logical size the bundled SVG icons are drawn at
+ICON_SIZE = 16
+
+
+@lru_cache(maxsize=None)
+def get_icon_paintable(icon_name: str, scale: int = 1) -> Gdk.Paintable:
+    # each SVG is rasterized once per scale and shared by every widget using it
+    path = f"{ICONS_PATH}/{icon_name}"
+    size = ICON_SIZE * max(scale, 1)
+
+    try:
+        pixbuf = GdkPixbuf.Pixbuf.new_from_resource_at_scale(path, size, size, True)
+    except GLib.Error:
+        pixbuf = None
+
+    if pixbuf is None:
+        # no loader could scale it, fall back to its natural size
+        return Gdk.Texture.new_from_resource(path)
+
+    return Gdk.Texture.new_for_pixbuf(pixbuf)
+
+
+def new_icon_image(icon_name: str, scale: int = 1) -> Gtk.Image:
+    image = Gtk.Image.new_from_paintable(get_icon_paintable(icon_name, scale))
+    image.set_pixel_size(ICON_SIZE)
+
+    return image
@@ -0,0 +1,71 @@
+from functools import lru_cache
+from typing import Any, cast
+
+from .docker import DockerSummary, get_summary_attribute, list_container_summaries
+
+
+def get_summary_name(summary: DockerSummary) -> str:
+    names = cast(list[str], summary.get("Names") or [])
+
+    if names:
+        return names[0].lstrip("/")
+
+    return summary.get("Id", "")[:12]
+
+
+class ContainerIndex:
+    by_image: dict[str, list[str]]
+    by_volume: dict[str, list[str]]
+    by_network: dict[str, list[str]]
+
+    def __init__(self, summaries: list[DockerSummary]) -> None:
+        self.by_image = {}
+        self.by_volume = {}
+        self.by_network = {}
+
+        for summary in summaries:
+            self.add(summary)
+
+    def add(self, summary: DockerSummary) -> None:
+        name = get_summary_name(summary)
+
+        image_id = summary.get("ImageID")
+
+        if image_id:
+            self.by_image.setdefault(image_id, []).append(name)
+
+        mounts = cast(list[dict[str, Any]], summary.get("Mounts") or [])
+
+        for mount in mounts:
+            if mount.get("Type") == "volume" and mount.get("Name"):
+                self.by_volume.setdefault(mount["Name"], []).append(name)
+
+        networks = cast(
+            dict[str, dict[str, Any]],
+            get_summary_attribute(summary, "NetworkSettings.Networks", {}),
+        )
+
+        for network_name, network in networks.items():
+            network_id = network.get("NetworkID") or network_name
+            self.by_network.setdefault(network_id, []).append(name)
+
+    def get_image_containers(self, image_id: str) -> list[str]:
+        return self.by_image.get(image_id, [])
+
+    def get_volume_containers(self, name: str) -> list[str]:
+        return self.by_volume.get(name, [])
+
+    def get_network_containers(self, network_id: str) -> list[str]:
+        return self.by_network.get(network_id, [])
+
+
+@lru_cache(maxsize=1)
+def _build_container_index() -> ContainerIndex:
+    return ContainerIndex(list_container_summaries())
+
+
+def get_container_index(refresh: bool = False) -> ContainerIndex:
+    if refresh:
+        _build_container_index.cache_clear()
+
+    return _build_container_index()
@@ -0,0 +1,188 @@
+from collections.abc import Callable
+from enum import Enum
+from functools import lru_cache
+from typing import cast
+
+from gi.repository import Adw, Gdk, GLib, GObject, Gtk
+
+# how long UI refreshes are held back while the window is visible but unfocused
+THROTTLED_INTERVAL_MS = 5000
+
+
+class Activity(Enum):
+    ACTIVE = "active"
+    THROTTLED = "throttled"
+    SUSPENDED = "suspended"
+    REMOVED = "removed"
+
+
+class Lifecycle:
+    window: Gtk.Window | None
+    nav_view: Adw.NavigationView | None
+    window_visible: bool
+    window_focused: bool
+    watchers: dict[Gtk.Widget, list[Callable[[Activity], None]]]
+
+    def __init__(self) -> None:
+        self.window = None
+        self.nav_view = None
+        self.window_visible = True
+        self.window_focused = True
+        self.watchers = {}
+
+    def attach(self, window: Gtk.Window, nav_view: Adw.NavigationView) -> None:
+        self.window = window
+        self.nav_view = nav_view
+
+        window.connect("notify::is-active", self._on_window_changed)
+        window.connect("notify::visible", self._on_window_changed)
+        window.connect("realize", self._on_window_realized)
+
+        nav_view.connect("notify::visible-page", self._on_window_changed)
+        nav_view.connect("popped", self._on_page_popped)
+
+    def get_activity(self, page: Gtk.Widget) -> Activity:
+        if self.nav_view is None:
+            return Activity.ACTIVE
+
+        if not self.window_visible or self.nav_view.get_visible_page() is not page:
+            return Activity.SUSPENDED
+
+        if not self.window_focused:
+            return Activity.THROTTLED
+
+        return Activity.ACTIVE
+
+    def watch(self, page: Gtk.Widget, callback: Callable[[Activity], None]) -> None:
+        self.watchers.setdefault(page, []).append(callback)
+
+    def notify(self) -> None:
+        for page, callbacks in list(self.watchers.items()):
+            activity = self.get_activity(page)
+
+            for callback in callbacks:
+                callback(activity)
+
+    def _update_window_state(self) -> None:
+        window = self.window
+
+        if window is None:
+            return
+
+        self.window_focused = window.is_active()
+        self.window_visible = window.get_visible()
+
+        surface = window.get_surface()
+
+        if surface is not None:
+            state = cast(Gdk.Toplevel, surface).get_state()
+            hidden = Gdk.ToplevelState.MINIMIZED | Gdk.ToplevelState.SUSPENDED
+
+            if state & hidden:
+                self.window_visible = False
+
+    def _on_window_realized(self, window: Gtk.Window) -> None:
+        surface = window.get_surface()
+
+        if surface is not None:
+            surface.connect("notify::state", self._on_window_changed)
+
+        self._on_window_changed()
+
+    def _on_window_changed(self, *_: GObject.Object | GObject.ParamSpec) -> None:
+        self._update_window_state()
+        self.notify()
+
+    def _on_page_popped(self, _: Adw.NavigationView, page: Adw.NavigationPage) -> None:
+        for callback in self.watchers.pop(page, []):
+            callback(Activity.REMOVED)
+
+
+@lru_cache(maxsize=1)
+def get_lifecycle() -> Lifecycle:
+    return Lifecycle()
+
+
+# coalesces refresh requests for a page and holds them back while it is hidden
+class PageScheduler:
+    page: Gtk.Widget
+    callback: Callable[[], None]
+    pending: bool
+    source_id: int
+    closed: bool
+    on_close: list[Callable[[], None]]
+
+    def __init__(self, page: Gtk.Widget, callback: Callable[[], None]) -> None:
+        self.page = page
+        self.callback = callback
+        self.pending = False
+        self.source_id = 0
+        self.closed = False
+        self.on_close = []
+
+        get_lifecycle().watch(page, self.on_activity_changed)
+
+    def request(self) -> bool:
+        self.pending = True
+        self._schedule()
+
+        # also usable as a one-shot GLib source callback
+        return False
+
+    def _schedule(self) -> None:
+        if self.closed or self.source_id:
+            return
+
+        activity = get_lifecycle().get_activity(self.page)
+
+        if activity == Activity.SUSPENDED:
+            return
+
+        delay = THROTTLED_INTERVAL_MS if activity == Activity.THROTTLED else 0
+        self.source_id = GLib.timeout_add(delay, self._flush)
+
+    def _flush(self) -> bool:
+        self.source_id = 0
+
+        if not self.pending or self.closed:
+            return False
+
+        if get_lifecycle().get_activity(self.page) == Activity.SUSPENDED:
+            return False
+
+        self.pending = False
+        self.callback()
+
+        return False
+
+    def on_activity_changed(self, activity: Activity) -> None:
+        if activity == Activity.REMOVED:
+            self.close()
+            return
+
+        if self.source_id and activity == Activity.ACTIVE:
+            # catch up right away instead of waiting for the throttled timeout
+            GLib.source_remove(self.source_id)
+            self.source_id = 0
+
+        if self.pending:
+            self._schedule()
+
+    def add_close_callback(self, callback: Callable[[], None]) -> None:
+        if self.closed:
+            callback()
+            return
+
+        self.on_close.append(callback)
+
+    def close(self) -> None:
+        if self.source_id:
+            GLib.source_remove(self.source_id)
+            self.source_id = 0
+
+        self.closed = True
+
+        for callback in self.on_close:
+            callback()
+
+        self.on_close.clear()
@@ -0,0 +1,225 @@
+import contextlib
+import errno
+import os
+import socketserver
+import stat
+import threading
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, cast
+
+from gi.repository import GLib
+
+from .docker import DockerSummary
+from .stats import StatsSample, get_stats_sampler
+from .store import get_container_store
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+UNIX_PREFIX = "unix:"
+
+# relative socket paths land here, the directory Flatpak shares with the host
+# at the same path, so the exporter needs no network access
+RUNTIME_SUBDIRECTORY = os.path.join("app", "com.scrlkx.dockery")
+
+# (name, type, help, sample key) of the metrics taken from the stats sampler
+SAMPLE_METRICS: list[tuple[str, str, str, str]] = [
+    ("cpu_seconds", "counter", "CPU time consumed", "cpu_seconds"),
+    ("memory_usage_bytes", "gauge", "Memory in use, without cache", "memory_usage"),
+    ("memory_limit_bytes", "gauge", "Memory limit", "memory_limit"),
+    ("network_receive_bytes", "counter", "Bytes received", "network_receive"),
+    ("network_transmit_bytes", "counter", "Bytes sent", "network_transmit"),
+    ("block_read_bytes", "counter", "Bytes read from block devices", "block_read"),
+    ("block_write_bytes", "counter", "Bytes written to block devices", "block_write"),
+    ("pids", "gauge", "Processes and threads", "pids"),
+]
+
+# (name, type, help, stats key) of the container event queue's counters
+QUEUE_METRICS: list[tuple[str, str, str, str]] = [
+    ("received", "counter", "Container events received", "received"),
+    ("merged", "counter", "Events replaced by a newer one", "merged"),
+    ("dropped", "counter", "Events dropped on overflow", "dropped"),
+    ("pending", "gauge", "Events waiting for the main loop", "pending"),
+]
+
+
+def escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(labels: dict[str, str]) -> str:
+    pairs = ",".join(f'{key}="{escape_label(value)}"' for key, value in labels.items())
+
+    return f"{{{pairs}}}"
+
+
+def get_summary_labels(summary: DockerSummary) -> dict[str, str]:
+    names = cast(list[str], summary.get("Names") or [])
+
+    return {
+        "id": summary.get("Id", "")[:12],
+        "name": names[0].lstrip("/") if names else "",
+    }
+
+
+def render_metrics(
+    summaries: list[DockerSummary],
+    samples: dict[str, StatsSample],
+    queue_stats: dict[str, int],
+) -> str:
+    lines = [
+        "# TYPE dockery_container info",
+        "# HELP dockery_container Container state, image and health",
+    ]
+
+    for summary in summaries:
+        labels = {
+            **get_summary_labels(summary),
+            "image": summary.get("Image", ""),
+            "state": summary.get("State", ""),
+            "health": summary.get("Health") or "",
+        }
+
+        lines.append(f"dockery_container_info{format_labels(labels)} 1")
+
+    for name, kind, description, key in SAMPLE_METRICS:
+        metric = f"dockery_container_{name}"
+        suffix = "_total" if kind == "counter" else ""
+
+        lines.append(f"# TYPE {metric} {kind}")
+        lines.append(f"# HELP {metric} {description}")
+
+        for summary in summaries:
+            sample = samples.get(summary.get("Id", ""))
+
+            if sample is not None:
+                labels = format_labels(get_summary_labels(summary))
+                lines.append(f"{metric}{suffix}{labels} {sample[key]}")
+
+    for name, kind, description, key in QUEUE_METRICS:
+        metric = f"dockery_event_queue_{name}"
+        suffix = "_total" if kind == "counter" else ""
+
+        lines.append(f"# TYPE {metric} {kind}")
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"{metric}{suffix} {queue_stats.get(key, 0)}")
+
+    lines.append("# EOF")
+
+    return "\n".join(lines) + "\n"
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        if self.path.partition("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+
+        # both snapshots are copies of what is already in memory, a scrape
+        # never reaches the daemon
+        store = get_container_store()
+
+        body = render_metrics(
+            store.snapshot(),
+            get_stats_sampler().snapshot(),
+            store.queue.get_stats(),
+        ).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    # pylint: disable-next=redefined-builtin
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self) -> tuple[Any, Any]:
+        # unix sockets have no peer address, http.server expects a tuple
+        request, _ = super().get_request()
+
+        return (request, ("local", 0))
+
+
+def parse_address(address: str) -> tuple[str, int] | str:
+    if address.startswith(UNIX_PREFIX):
+        return os.path.join(
+            GLib.get_user_runtime_dir(),
+            RUNTIME_SUBDIRECTORY,
+            address.removeprefix(UNIX_PREFIX),
+        )
+
+    host, _, port = address.rpartition(":")
+
+    return (host.strip("[]") or "127.0.0.1", int(port))
+
+
+def remove_stale_socket(path: str) -> None:
+    # a previous run may have left its socket behind, anything else at the
+    # path is not ours to delete
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(errno.EEXIST, "Not a socket", path)
+
+    os.unlink(path)
+
+
+class MetricsExporter:
+    server: socketserver.BaseServer | None
+    socket_path: str
+
+    def __init__(self) -> None:
+        self.server = None
+        self.socket_path = ""
+
+    def start(self, address: str) -> None:
+        self.stop()
+
+        target = parse_address(address)
+
+        if isinstance(target, str):
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            remove_stale_socket(target)
+
+            self.server = UnixHTTPServer(target, MetricsHandler)
+            self.socket_path = target
+        else:
+            self.server = ThreadingHTTPServer(target, MetricsHandler)
+
+        get_stats_sampler().start()
+
+        thread = threading.Thread(
+            target=self.server.serve_forever, name="dockery_metrics", daemon=True
+        )
+        thread.start()
+
+    def stop(self) -> None:
+        if self.server is None:
+            return
+
+        get_stats_sampler().stop()
+
+        self.server.shutdown()
+        self.server.server_close()
+        self.server = None
+
+        if self.socket_path:
+            # the runtime directory may have been cleaned up already
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.socket_path)
+
+            self.socket_path = ""
+
+
+@lru_cache(maxsize=1)
+def get_metrics_exporter() -> MetricsExporter:
+    return MetricsExporter()
@@ -0,0 +1,43 @@
+import time
+
+from gi.repository import Gio
+
+# per container, so a looping container does not notify on every crash
+CONTAINER_COOLDOWN_SECONDS = 10 * 60
+# across containers, so a mass failure does not flood the desktop
+GLOBAL_COOLDOWN_SECONDS = 30
+
+
+class NotificationLimiter:
+    last_sent: dict[str, float]
+    last_any: float
+
+    def __init__(self) -> None:
+        self.last_sent = {}
+        self.last_any = 0
+
+    def allow(self, key: str) -> bool:
+        now = time.monotonic()
+
+        if now - self.last_any < GLOBAL_COOLDOWN_SECONDS:
+            return False
+
+        if now - self.last_sent.get(key, -CONTAINER_COOLDOWN_SECONDS) < (
+            CONTAINER_COOLDOWN_SECONDS
+        ):
+            return False
+
+        self.last_any = now
+        self.last_sent[key] = now
+
+        return True
+
+
+def send_crash_loop_notification(
+    app: Gio.Application, container_id: str, name: str
+) -> None:
+    notification = Gio.Notification.new(f"{name or container_id[:12]} is crash looping")
+    notification.set_body("The container keeps exiting shortly after starting.")
+    notification.set_priority(Gio.NotificationPriority.HIGH)
+
+    app.send_notification(f"crash-loop-{container_id}", notification)
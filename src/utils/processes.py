@@ -0,0 +1,54 @@
+from typing import TypedDict
+
+from .docker import get_docker_client
+
+BASE_INTERVAL_MS = 2000
+MAX_INTERVAL_MS = 30000
+
+# growth of the interval for every poll that finds the same processes
+BACKOFF_FACTOR = 1.5
+
+# a slow daemon is polled at most once per this many round trips
+LATENCY_FACTOR = 10
+
+# rows shown, a runaway fork bomb should not freeze the page
+MAX_PROCESSES = 200
+
+
+class ProcessTable(TypedDict):
+    titles: list[str]
+    processes: dict[str, list[str]]
+
+
+def get_process_table(container_id: str) -> ProcessTable:
+    result = get_docker_client().api.top(container_id)
+
+    titles = result["Titles"] or []
+    rows = result["Processes"] or []
+
+    # the PID column is keyed on, whatever ps arguments the daemon used
+    pid_column = titles.index("PID") if "PID" in titles else 0
+
+    return {
+        "titles": titles,
+        "processes": {row[pid_column]: row for row in rows[:MAX_PROCESSES]},
+    }
+
+
+def diff_processes(
+    old: dict[str, list[str]], new: dict[str, list[str]]
+) -> tuple[list[str], list[str], list[str]]:
+    added = [pid for pid in new if pid not in old]
+    changed = [pid for pid in new if pid in old and old[pid] != new[pid]]
+    removed = [pid for pid in old if pid not in new]
+
+    return (added, changed, removed)
+
+
+def get_next_interval(interval: int, changed: bool, latency_ms: int) -> int:
+    if changed:
+        interval = BASE_INTERVAL_MS
+    else:
+        interval = int(interval * BACKOFF_FACTOR)
+
+    return min(max(interval, latency_ms * LATENCY_FACTOR), MAX_INTERVAL_MS)
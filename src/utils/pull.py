@@ -0,0 +1,239 @@
+import json
+import logging
+import socket
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, TypedDict, cast
+
+from docker import auth
+from docker.errors import DockerException, create_api_error_from_http_exception
+from docker.utils import parse_repository_tag
+from gi.repository import GLib
+from requests import Response
+from requests.exceptions import HTTPError, RequestException
+
+from .docker import get_docker_client
+
+# a few UI updates per second, whatever the rate of daemon messages
+PROGRESS_INTERVAL_SECONDS = 0.25
+
+# statuses that describe the whole pull rather than a single layer
+PULL_STATUSES = ("Pulling from", "Digest:", "Status:", "Pulling repository")
+
+DONE_STATUSES = ("Pull complete", "Already exists")
+DOWNLOADED_STATUSES = ("Verifying Checksum", "Download complete")
+
+logger = logging.getLogger(__name__)
+
+
+class LayerProgress(TypedDict):
+    size: int
+    downloaded: int
+    extracted: int
+    done: bool
+
+
+class PullSummary(TypedDict):
+    status: str
+    layers: int
+    completed: int
+    downloaded: int
+    total: int
+    fraction: float
+    error: str
+
+
+class PullProgress:
+    # folds the per-layer progress messages of a pull into one model,
+    # each message only touches its own layer
+    status: str
+    error: str
+    layers: dict[str, LayerProgress]
+
+    def __init__(self) -> None:
+        self.status = "Waiting"
+        self.error = ""
+        self.layers = {}
+
+    def update(self, message: dict[str, Any]) -> None:
+        if message.get("error"):
+            self.error = str(message["error"])
+            return
+
+        status = str(message.get("status", ""))
+        layer_id = message.get("id")
+
+        if not layer_id or status.startswith(PULL_STATUSES):
+            self.status = status
+            return
+
+        layer = self.layers.setdefault(
+            layer_id, {"size": 0, "downloaded": 0, "extracted": 0, "done": False}
+        )
+        detail = cast(dict[str, int], message.get("progressDetail") or {})
+
+        if detail.get("total"):
+            layer["size"] = int(detail["total"])
+
+        if status == "Downloading":
+            layer["downloaded"] = int(detail.get("current", 0))
+        elif status in DOWNLOADED_STATUSES:
+            layer["downloaded"] = layer["size"]
+        elif status == "Extracting":
+            layer["downloaded"] = layer["size"]
+            layer["extracted"] = int(detail.get("current", 0))
+        elif status in DONE_STATUSES:
+            layer["downloaded"] = layer["extracted"] = layer["size"]
+            layer["done"] = True
+
+    def get_summary(self) -> PullSummary:
+        layers = self.layers.values()
+
+        completed = sum(1 for layer in layers if layer["done"])
+        total = sum(layer["size"] for layer in layers)
+        downloaded = sum(layer["downloaded"] for layer in layers)
+        extracted = sum(layer["extracted"] for layer in layers)
+
+        if total:
+            # downloading and extracting weigh the same
+            fraction = (downloaded + extracted) / (2 * total)
+        elif layers:
+            fraction = completed / len(layers)
+        else:
+            fraction = 0
+
+        return {
+            "status": self.status,
+            "layers": len(layers),
+            "completed": completed,
+            "downloaded": downloaded,
+            "total": total,
+            "fraction": min(fraction, 1),
+            "error": self.error,
+        }
+
+
+def open_pull(reference: str) -> Response:
+    # what api.pull does, but keeping the response so that a cancel can shut
+    # its connection down
+    api = get_docker_client().api
+
+    repository, tag = parse_repository_tag(reference)
+    registry, _ = auth.resolve_repository_name(repository)
+
+    headers: dict[str, Any] = {}
+    # the client parameter is untyped in the stubs
+    header = cast(bytes | None, cast(Any, auth).get_config_header(api, registry))
+
+    if header:
+        headers["X-Registry-Auth"] = header
+
+    response = api.post(
+        f"{api.base_url}/v{api.api_version}/images/create",
+        params={"fromImage": repository, "tag": tag or "latest"},
+        headers=headers,
+        stream=True,
+    )
+
+    try:
+        response.raise_for_status()
+    except HTTPError as error:
+        response.close()
+        create_api_error_from_http_exception(error)
+
+    return response
+
+
+def shutdown_response(response: Response) -> None:
+    # closing the response would not wake the read blocked in the pull
+    # thread, shutting its socket down does
+    sock = getattr(response.raw.connection, "sock", None)
+
+    if isinstance(sock, socket.socket):
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+class ImagePull:
+    reference: str
+    cancelled: threading.Event
+    response: Response | None
+    on_progress: Callable[[PullSummary], None]
+    on_done: Callable[[PullSummary], None]
+
+    def __init__(
+        self,
+        reference: str,
+        on_progress: Callable[[PullSummary], None],
+        on_done: Callable[[PullSummary], None],
+    ) -> None:
+        self.reference = reference
+        self.cancelled = threading.Event()
+        self.response = None
+        self.on_progress = on_progress
+        self.on_done = on_done
+
+    def start(self) -> None:
+        thread = threading.Thread(
+            target=self._run, name="docker_image_pull", daemon=True
+        )
+        thread.start()
+
+    def cancel(self) -> None:
+        self.cancelled.set()
+
+        response = self.response
+
+        if response is not None:
+            shutdown_response(response)
+
+    def _run(self) -> None:
+        progress = PullProgress()
+
+        # on_done has to fire whatever happens, or the group never takes
+        # another pull; reads after a cancel fail in all sorts of ways
+        try:
+            self._stream(progress)
+        except (DockerException, RequestException) as error:
+            progress.error = str(error)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            logger.exception("Pulling %s failed", self.reference)
+            progress.error = str(error)
+
+        if self.cancelled.is_set():
+            progress.error = "Cancelled"
+
+        GLib.idle_add(self.on_done, progress.get_summary())
+
+    def _stream(self, progress: PullProgress) -> None:
+        response = open_pull(self.reference)
+        self.response = response
+
+        # a cancel that came before the response was set
+        if self.cancelled.is_set():
+            shutdown_response(response)
+
+        reported_at = 0.0
+
+        try:
+            # the daemon sends one message per line as it goes, and aborts
+            # the pull once the connection is gone
+            for line in response.iter_lines(chunk_size=None):
+                if self.cancelled.is_set():
+                    break
+
+                if not line:
+                    continue
+
+                progress.update(cast(dict[str, Any], json.loads(line)))
+                now = time.monotonic()
+
+                if now - reported_at >= PROGRESS_INTERVAL_SECONDS:
+                    reported_at = now
+                    GLib.idle_add(self.on_progress, progress.get_summary())
+        finally:
+            self.response = None
+            response.close()
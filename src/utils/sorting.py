@@ -0,0 +1,152 @@
+from typing import TypedDict
+
+from docker.models.containers import Container
+from gi.repository import GObject, Gtk
+
+from .docker import (
+    get_container_created_at,
+    get_container_image,
+    get_container_restart_count,
+    get_container_started_at,
+    get_container_status_rank,
+)
+from .ui import iso_to_timestamp
+
+# stands in for "never started" so stopped containers sort after running ones
+NOT_RUNNING = 2**62
+
+
+class SortOption(TypedDict):
+    key: str
+    label: str
+    property: str
+    numeric: bool
+    descending: bool
+
+
+SORT_OPTIONS: list[SortOption] = [
+    {
+        "key": "status",
+        "label": "Status",
+        "property": "status-rank",
+        "numeric": True,
+        "descending": False,
+    },
+    {
+        "key": "name",
+        "label": "Name",
+        "property": "name-key",
+        "numeric": False,
+        "descending": False,
+    },
+    {
+        "key": "image",
+        "label": "Image",
+        "property": "image-key",
+        "numeric": False,
+        "descending": False,
+    },
+    {
+        "key": "created",
+        "label": "Created",
+        "property": "created",
+        "numeric": True,
+        "descending": True,
+    },
+    {
+        "key": "uptime",
+        "label": "Uptime",
+        "property": "started",
+        "numeric": True,
+        "descending": False,
+    },
+    {
+        "key": "restarts",
+        "label": "Restarts",
+        "property": "restart-count",
+        "numeric": True,
+        "descending": True,
+    },
+]
+
+
+def get_sort_option(key: str) -> SortOption:
+    for option in SORT_OPTIONS:
+        if option["key"] == key:
+            return option
+
+    return SORT_OPTIONS[0]
+
+
+class ContainerItem(GObject.Object):
+    # sort keys are computed once here, so the sorters only compare
+    # plain properties instead of calling back into Python
+    __gtype_name__ = "ContainerItem"
+
+    container_id = GObject.Property(type=str)
+    name = GObject.Property(type=str)
+    image = GObject.Property(type=str)
+    flapping_rank = GObject.Property(type=int)
+    status_rank = GObject.Property(type=int)
+    name_key = GObject.Property(type=str)
+    image_key = GObject.Property(type=str)
+    created = GObject.Property(type=GObject.TYPE_INT64)
+    started = GObject.Property(type=GObject.TYPE_INT64)
+    restart_count = GObject.Property(type=int)
+
+    container: Container
+
+    def __init__(self, container: Container, flapping: bool) -> None:
+        image = get_container_image(container) or ""
+        created_at = get_container_created_at(container)
+        started_at = get_container_started_at(container)
+
+        started = NOT_RUNNING
+
+        if container.status == "running" and started_at:
+            started = iso_to_timestamp(started_at)
+
+        super().__init__(
+            container_id=container.id,
+            name=container.name,
+            image=image,
+            flapping_rank=0 if flapping else 1,
+            status_rank=get_container_status_rank(container),
+            name_key=container.name.casefold(),
+            image_key=image.casefold(),
+            created=iso_to_timestamp(created_at) if created_at else 0,
+            started=started,
+            restart_count=get_container_restart_count(container),
+        )
+
+        self.container = container
+
+
+def build_property_sorter(
+    name: str, numeric: bool, descending: bool = False
+) -> Gtk.Sorter:
+    expression = Gtk.PropertyExpression.new(ContainerItem, None, name)
+
+    if not numeric:
+        return Gtk.StringSorter(expression=expression, ignore_case=False)
+
+    order = Gtk.SortType.DESCENDING if descending else Gtk.SortType.ASCENDING
+
+    return Gtk.NumericSorter(expression=expression, sort_order=order)
+
+
+def build_container_sorter(key: str) -> Gtk.Sorter:
+    option = get_sort_option(key)
+
+    sorter = Gtk.MultiSorter()
+
+    # crash-looping containers always go first, then the chosen key, then name
+    sorter.append(build_property_sorter("flapping-rank", True))
+    sorter.append(
+        build_property_sorter(
+            option["property"], option["numeric"], option["descending"]
+        )
+    )
+    sorter.append(build_property_sorter("name-key", False))
+
+    return sorter
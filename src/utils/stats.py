@@ -0,0 +1,150 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, TypedDict, cast
+
+from docker.errors import DockerException
+from requests.exceptions import RequestException
+
+from .docker import get_docker_client
+from .store import get_container_store
+
+# time between two rounds of samples; the byte and CPU counters are totals,
+# so a longer interval only makes the gauges coarser
+SAMPLE_INTERVAL_SECONDS = 5
+
+# stats requests in flight at once, each holding a daemon connection
+MAX_REQUESTS = 4
+
+
+class StatsSample(TypedDict):
+    cpu_seconds: float
+    memory_usage: int
+    memory_limit: int
+    network_receive: int
+    network_transmit: int
+    block_read: int
+    block_write: int
+    pids: int
+
+
+def get_block_bytes(stats: dict[str, Any], operation: str) -> int:
+    blkio = cast(dict[str, Any], stats.get("blkio_stats") or {})
+    entries = cast(list[dict[str, Any]], blkio.get("io_service_bytes_recursive") or [])
+
+    return sum(
+        int(entry.get("value", 0))
+        for entry in entries
+        if str(entry.get("op", "")).lower() == operation
+    )
+
+
+def parse_stats(stats: dict[str, Any]) -> StatsSample:
+    cpu = cast(dict[str, Any], stats.get("cpu_stats") or {})
+    memory = cast(dict[str, Any], stats.get("memory_stats") or {})
+    cpu_usage = cast(dict[str, int], cpu.get("cpu_usage") or {})
+    pids = cast(dict[str, int], stats.get("pids_stats") or {})
+    networks = cast(dict[str, dict[str, int]], stats.get("networks") or {})
+
+    # page cache is reclaimable, leave it out like `docker stats` does
+    memory_details = cast(dict[str, int], memory.get("stats") or {})
+    cache = memory_details.get("inactive_file", memory_details.get("cache", 0))
+
+    return {
+        "cpu_seconds": cpu_usage.get("total_usage", 0) / 1e9,
+        "memory_usage": max(int(memory.get("usage", 0)) - cache, 0),
+        "memory_limit": int(memory.get("limit", 0)),
+        "network_receive": sum(net.get("rx_bytes", 0) for net in networks.values()),
+        "network_transmit": sum(net.get("tx_bytes", 0) for net in networks.values()),
+        "block_read": get_block_bytes(stats, "read"),
+        "block_write": get_block_bytes(stats, "write"),
+        "pids": pids.get("current", 0),
+    }
+
+
+def get_stats_sample(container_id: str) -> StatsSample | None:
+    try:
+        # one_shot skips the second sample the daemon would wait a second for
+        stats = get_docker_client().api.stats(container_id, stream=False, one_shot=True)
+    except (DockerException, RequestException):
+        # most likely stopped meanwhile
+        return None
+
+    return parse_stats(cast(dict[str, Any], stats))
+
+
+class StatsSampler:
+    # one shared timer polls a single stats sample of every running container,
+    # at most MAX_REQUESTS at a time, so the daemon connections stay bounded
+    # however many containers run; readers get copies under the lock from
+    # any thread
+    samples: dict[str, StatsSample]
+    lock: threading.Lock
+    stopped: threading.Event | None
+
+    def __init__(self) -> None:
+        self.samples = {}
+        self.lock = threading.Lock()
+        self.stopped = None
+
+    def start(self) -> None:
+        if self.stopped is not None:
+            return
+
+        stopped = threading.Event()
+        self.stopped = stopped
+
+        get_container_store().start()
+
+        thread = threading.Thread(
+            target=self._poll,
+            args=(stopped,),
+            name="docker_container_stats",
+            daemon=True,
+        )
+        thread.start()
+
+    def stop(self) -> None:
+        if self.stopped is None:
+            return
+
+        self.stopped.set()
+        self.stopped = None
+
+        with self.lock:
+            self.samples.clear()
+
+    def _poll(self, stopped: threading.Event) -> None:
+        with ThreadPoolExecutor(MAX_REQUESTS, "docker_container_stats") as executor:
+            while not stopped.is_set():
+                running = [
+                    summary["Id"]
+                    for summary in get_container_store().snapshot()
+                    if summary.get("State") == "running"
+                ]
+
+                samples = {
+                    container_id: sample
+                    for container_id, sample in zip(
+                        running, executor.map(get_stats_sample, running)
+                    )
+                    if sample is not None
+                }
+
+                if stopped.is_set():
+                    break
+
+                # stopped containers drop out with the next round
+                with self.lock:
+                    self.samples = samples
+
+                stopped.wait(SAMPLE_INTERVAL_SECONDS)
+
+    def snapshot(self) -> dict[str, StatsSample]:
+        with self.lock:
+            return dict(self.samples)
+
+
+@lru_cache(maxsize=1)
+def get_stats_sampler() -> StatsSampler:
+    return StatsSampler()
@@ -0,0 +1,316 @@
+import re
+import threading
+import time
+from collections.abc import Callable
+from functools import lru_cache
+
+from gi.repository import GLib, Gtk
+
+from .docker import DockerSummary, list_container_summaries
+from .event_queue import EventQueue
+from .events import (
+    STATE_ACTIONS,
+    DockerEvent,
+    get_container_events,
+    get_event_action,
+    get_event_container_id,
+)
+from .lifecycle import PageScheduler
+from .threads import run_in_background
+
+HEALTH_PATTERN = re.compile(r"\((healthy|unhealthy|health: starting)\)")
+
+# state a container is left in after each action
+ACTION_STATES = {
+    "start": "running",
+    "restart": "running",
+    "unpause": "running",
+    "pause": "paused",
+    "die": "exited",
+    "stop": "exited",
+}
+
+# a failed listing is tried again after this long, the store stays empty until then
+REFRESH_RETRY_SECONDS = 5
+
+# actions that end or begin a run, after which the old health no longer applies
+HEALTH_RESET_ACTIONS = ("die", "stop", "start", "restart")
+
+# actions that begin a run, a container with a health check starts over
+HEALTH_START_ACTIONS = ("start", "restart")
+
+STORE_ACTIONS = [*STATE_ACTIONS, "create", "health_status"]
+
+StoreListener = Callable[[set[str]], None]
+
+
+def parse_summary_health(summary: DockerSummary) -> str | None:
+    match = HEALTH_PATTERN.search(summary.get("Status", ""))
+
+    if not match:
+        return None
+
+    return match.group(1).removeprefix("health: ")
+
+
+def set_summary_health(summary: DockerSummary) -> None:
+    health = parse_summary_health(summary)
+
+    summary["Health"] = health
+
+    # only a running container shows its health in the status, so a stopped
+    # one without it may still have a health check
+    if health is not None:
+        summary["HasHealthcheck"] = True
+    elif summary.get("State") == "running":
+        summary["HasHealthcheck"] = False
+    else:
+        summary["HasHealthcheck"] = None
+
+
+def get_event_health(event: DockerEvent) -> str:
+    return event.get("Action", "").partition(":")[2].strip()
+
+
+class ContainerStore:  # pylint: disable=too-many-instance-attributes
+    # container summaries keyed by ID, filled by one listing and then kept
+    # current from the event stream instead of re-listing or inspecting;
+    # only touched from the main loop once started
+    containers: dict[str, DockerSummary]
+    loading: set[str]
+    # when an event last changed each container, on the local monotonic
+    # clock, so a listing started before then does not overwrite it
+    updated: dict[str, int]
+    listeners: list[StoreListener]
+    queue: EventQueue
+    lock: threading.Lock
+    started: bool
+    loaded: bool
+
+    def __init__(self) -> None:
+        self.containers = {}
+        self.loading = set()
+        self.updated = {}
+        self.listeners = []
+        self.queue = EventQueue(self.apply_events, self.refresh)
+        self.lock = threading.Lock()
+        self.started = False
+        self.loaded = False
+
+    def start(self) -> None:
+        if self.started:
+            return
+
+        self.started = True
+
+        get_container_events().add_listener(self.enqueue)
+
+        self.refresh()
+
+    def enqueue(self, event: DockerEvent) -> None:
+        if get_event_action(event) in STORE_ACTIONS:
+            self.queue.put(event)
+
+    def refresh(self) -> None:
+        listed_at = time.monotonic_ns()
+
+        run_in_background(
+            list_container_summaries,
+            lambda summaries: self._replace(summaries, listed_at),
+            "docker_container_store",
+            self._on_refresh_failed,
+        )
+
+    def _on_refresh_failed(self, _: Exception) -> None:
+        GLib.timeout_add_seconds(REFRESH_RETRY_SECONDS, self._retry_refresh)
+
+    def _retry_refresh(self) -> bool:
+        self.refresh()
+
+        return False
+
+    def _is_newer(self, container_id: str, listed_at: int) -> bool:
+        return self.updated.get(container_id, 0) > listed_at
+
+    def _replace(self, summaries: list[DockerSummary], listed_at: int) -> None:
+        with self.lock:
+            # removed containers count as changed too
+            changed = set(self.containers)
+            previous = self.containers
+            self.containers = {}
+
+            for summary in summaries:
+                set_summary_health(summary)
+                self.containers[summary["Id"]] = summary
+
+            # events applied while listing are newer than what it returned,
+            # including a destroy of a container it still saw
+            for container_id in [*self.containers, *previous]:
+                if not self._is_newer(container_id, listed_at):
+                    continue
+
+                if container_id in previous:
+                    self.containers[container_id] = previous[container_id]
+                else:
+                    self.containers.pop(container_id, None)
+
+            self.updated = {
+                container_id: updated_at
+                for container_id, updated_at in self.updated.items()
+                if updated_at > listed_at
+            }
+
+            changed |= set(self.containers)
+
+        self.loaded = True
+        self._notify(changed)
+
+    def _load(self, container_id: str) -> None:
+        if container_id in self.loading:
+            return
+
+        self.loading.add(container_id)
+        listed_at = time.monotonic_ns()
+
+        run_in_background(
+            lambda: list_container_summaries({"id": [container_id]}),
+            lambda summaries: self._add(container_id, summaries, listed_at),
+            "docker_container_store_load",
+            # the next event for the container tries again
+            lambda _: self.loading.discard(container_id),
+        )
+
+    def _add(
+        self, container_id: str, summaries: list[DockerSummary], listed_at: int
+    ) -> None:
+        self.loading.discard(container_id)
+
+        with self.lock:
+            # a start or destroy may have come in meanwhile
+            if self._is_newer(container_id, listed_at):
+                summaries = []
+
+            for summary in summaries:
+                set_summary_health(summary)
+                self.containers[summary["Id"]] = summary
+
+        if summaries:
+            self._notify({container_id})
+
+    def apply_events(self, events: list[DockerEvent]) -> None:
+        changed: set[str] = set()
+
+        for event in events:
+            if self.apply_event(event):
+                changed.add(get_event_container_id(event))
+
+        if changed:
+            self._notify(changed)
+
+    def apply_event(self, event: DockerEvent) -> bool:
+        container_id = get_event_container_id(event)
+        action = get_event_action(event)
+
+        with self.lock:
+            if action == "destroy":
+                self.updated[container_id] = time.monotonic_ns()
+                return self.containers.pop(container_id, None) is not None
+
+            summary = self.containers.get(container_id)
+
+            if summary is None:
+                # created or missed while listing, fetch just this one
+                self._load(container_id)
+                return False
+
+            if action == "health_status":
+                summary["Health"] = get_event_health(event)
+                summary["HasHealthcheck"] = True
+            elif action in ACTION_STATES:
+                summary["State"] = ACTION_STATES[action]
+
+                # the queue may have merged a die into this start, so health
+                # from the previous run never carries over either way
+                if action in HEALTH_RESET_ACTIONS:
+                    summary["Health"] = None
+
+                if action in HEALTH_START_ACTIONS:
+                    self._start_health(container_id, summary)
+            else:
+                return False
+
+            self.updated[container_id] = time.monotonic_ns()
+
+        return True
+
+    def _start_health(self, container_id: str, summary: DockerSummary) -> None:
+        # no event reports "starting", the daemon only sends the first result
+        has_healthcheck = summary.get("HasHealthcheck")
+
+        if has_healthcheck:
+            summary["Health"] = "starting"
+        elif has_healthcheck is None:
+            # listed while stopped, the running container's status tells
+            self._load(container_id)
+
+    def _notify(self, container_ids: set[str]) -> None:
+        for listener in list(self.listeners):
+            listener(container_ids)
+
+    def add_listener(self, listener: StoreListener) -> None:
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener: StoreListener) -> None:
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def snapshot(self) -> list[DockerSummary]:
+        # safe from any thread, the summaries are copied under the lock
+        with self.lock:
+            return [dict(summary) for summary in self.containers.values()]
+
+    def get_health(self, container_id: str) -> str | None:
+        with self.lock:
+            summary = self.containers.get(container_id)
+
+            return summary.get("Health") if summary else None
+
+
+@lru_cache(maxsize=1)
+def get_container_store() -> ContainerStore:
+    return ContainerStore()
+
+
+def on_containers_change(on_change: Callable[[set[str]], None], page: Gtk.Widget):
+    store = get_container_store()
+    pending: set[str] = set()
+
+    def _flush() -> None:
+        container_ids = set(pending)
+        pending.clear()
+
+        on_change(container_ids)
+
+    scheduler = PageScheduler(page, _flush)
+
+    def _on_change(container_ids: set[str]) -> None:
+        # held back while the page is hidden, so keep every ID seen meanwhile
+        pending.update(container_ids)
+        scheduler.request()
+
+    store.add_listener(_on_change)
+    scheduler.add_close_callback(lambda: store.remove_listener(_on_change))
+
+
+def on_container_change(
+    on_change: Callable[[], None], container_id: str, page: Gtk.Widget
+):
+    store = get_container_store()
+    scheduler = PageScheduler(page, on_change)
+
+    def _on_change(container_ids: set[str]) -> None:
+        if container_id in container_ids:
+            scheduler.request()
+
+    store.add_listener(_on_change)
+    scheduler.add_close_callback(lambda: store.remove_listener(_on_change))
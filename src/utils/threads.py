@@ -0,0 +1,39 @@
+import logging
+import threading
+from collections.abc import Callable
+from typing import TypeVar
+
+from gi.repository import GLib
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+def run_in_background(
+    work: Callable[[], T],
+    on_done: Callable[[T], None],
+    name: str,
+    on_error: Callable[[Exception], None] | None = None,
+) -> None:
+    def _run() -> None:
+        try:
+            result = work()
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            # on_done never runs then, callers restore their UI in on_error
+            logger.exception("Background task %s failed", name)
+
+            if on_error is not None:
+                GLib.idle_add(on_error, error)
+
+            return
+
+        GLib.idle_add(on_done, result)
+
+    thread = threading.Thread(
+        target=_run,
+        name=name,
+        daemon=True,
+    )
+
+    thread.start()
@@ -29,6 +29,26 @@ def get_container_status_class(container: Container) -> str | None:
     return classes.get(container.status)
 
 
+def get_health_status_label(health: str | None) -> str | None:
+    labels = {
+        "healthy": "Healthy",
+        "unhealthy": "Unhealthy",
+        "starting": "Starting",
+    }
+
+    return labels.get(health or "")
+
+
+def get_health_status_class(health: str | None) -> str | None:
+    classes = {
+        "healthy": "tag-green",
+        "unhealthy": "tag-red",
+        "starting": "tag-blue",
+    }
+
+    return classes.get(health or "")
+
+
 def get_container_action_label(action: str) -> str | None:
     actions = {
         "start": "Start",
@@ -38,6 +58,8 @@ def get_container_action_label(action: str) -> str | None:
         "restart": "Restart",
         "kill": "Kill",
         "remove": "Remove",
+        "terminal": "Terminal",
+        "files": "Files",
     }
 
     return actions.get(action)
@@ -52,11 +74,57 @@ def get_container_action_icon(action: str) -> str | None:
         "restart": "reload.svg",
         "kill": "cross.svg",
         "remove": "trash.svg",
+        "terminal": "terminal.svg",
+        "files": "folder.svg",
     }
 
     return actions.get(action)
 
 
+def get_event_action_label(action: str) -> str:
+    labels = {
+        "create": "Created",
+        "start": "Started",
+        "stop": "Stopped",
+        "die": "Exited",
+        "kill": "Killed",
+        "oom": "Out of memory",
+        "pause": "Paused",
+        "unpause": "Resumed",
+        "restart": "Restarted",
+        "destroy": "Removed",
+        "health_status": "Health check",
+    }
+
+    return labels.get(action, action)
+
+
+def get_event_detail_label(detail: dict[str, str]) -> str:
+    parts: list[str] = []
+
+    if "status" in detail:
+        parts.append(detail["status"])
+
+    if "exitCode" in detail:
+        parts.append(f"exit code {detail['exitCode']}")
+
+    if "signal" in detail:
+        parts.append(f"signal {detail['signal']}")
+
+    return ", ".join(parts)
+
+
+def get_disk_usage_label(category: str) -> str | None:
+    labels = {
+        "images": "Images",
+        "containers": "Containers",
+        "volumes": "Volumes",
+        "build_cache": "Build Cache",
+    }
+
+    return labels.get(category)
+
+
 def iso_to_local(original: str) -> str:
     date_time = datetime.fromisoformat(original.replace("Z", "+00:00"))
     local_date_time = date_time.astimezone()
@@ -64,6 +132,20 @@ def iso_to_local(original: str) -> str:
     return local_date_time.strftime("%c")
 
 
+def iso_to_timestamp(original: str) -> int:
+    date_time = datetime.fromisoformat(original.replace("Z", "+00:00"))
+
+    return int(date_time.timestamp())
+
+
+def timestamp_to_local(timestamp: int) -> str:
+    return datetime.fromtimestamp(timestamp).astimezone().strftime("%c")
+
+
+def short_id(identifier: str) -> str:
+    return identifier.removeprefix("sha256:")[:12]
+
+
 def humanize_mount_mode(mode: str | None) -> str:
     if not mode:
         return "Read-write"
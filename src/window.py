@@ -1,10 +1,23 @@
-from typing import Any
+from typing import Any, Callable
 
 from docker.models.containers import Container
-from gi.repository import Adw, Gtk
+from gi.repository import Adw, Gio, GLib, Gtk
 
 from .pages.container_page import ContainerPage
 from .pages.containers_page import ContainersPage
+from .pages.disk_usage_page import DiskUsagePage
+from .pages.files_page import FilesPage
+from .pages.image_page import ImagePage
+from .pages.images_page import ImagesPage
+from .pages.network_page import NetworkPage
+from .pages.networks_page import NetworksPage
+from .pages.terminal_page import TerminalPage
+from .pages.volume_page import VolumePage
+from .pages.volumes_page import VolumesPage
+from .utils.flapping import get_flapping_detector
+from .utils.history import get_event_history
+from .utils.lifecycle import get_lifecycle
+from .utils.store import get_container_store
 
 
 @Gtk.Template(resource_path="/com/scrlkx/dockery/window.ui")
@@ -20,6 +33,16 @@ class DockeryWindow(Adw.ApplicationWindow):
 
         self.back_button.connect("clicked", self._on_back_clicked)
 
+        get_lifecycle().attach(self, self.nav_view)
+        get_event_history().start()
+        get_flapping_detector().start()
+        get_container_store().start()
+
+        self._create_action("show-disk-usage", self._on_show_disk_usage)
+        self._create_action("show-images", self._on_show_images)
+        self._create_action("show-volumes", self._on_show_volumes)
+        self._create_action("show-networks", self._on_show_networks)
+
         containers_page = ContainersPage()
         containers_page.connect(
             "container-activated",
@@ -28,14 +51,80 @@ class DockeryWindow(Adw.ApplicationWindow):
 
         self.nav_view.push(containers_page)
 
+    def _create_action(
+        self, name: str, callback: Callable[[Gio.SimpleAction, Any], None]
+    ) -> None:
+        action = Gio.SimpleAction.new(name, None)
+        action.connect("activate", callback)
+
+        self.add_action(action)
+
     def _on_back_clicked(self, _: Gtk.Button) -> None:
         self.nav_view.pop()
 
         if self.nav_view.get_visible_page() is not None:
             self.back_button.set_visible(False)
 
-    def _on_container_activated(self, _: Gtk.Widget, container: Container) -> None:
+    def _push_page(self, page: Adw.NavigationPage) -> None:
         self.back_button.set_visible(True)
+        self.nav_view.push(page)
+
+    def _push_container_page(self, name: str) -> None:
+        page = ContainerPage(name)
+        page.connect("terminal-requested", self._on_terminal_requested)
+        page.connect("files-requested", self._on_files_requested)
+
+        self._push_page(page)
+
+    def _on_container_activated(self, _: Gtk.Widget, container: Container) -> None:
+        self._push_container_page(container.name)
+
+    def _on_container_name_activated(self, _: Gtk.Widget, name: str) -> None:
+        self._push_container_page(name)
+
+    def _on_terminal_requested(
+        self, _: Gtk.Widget, name: str, container_id: str
+    ) -> None:
+        self._push_page(TerminalPage(name, container_id))
+
+    def _on_files_requested(self, _: Gtk.Widget, name: str, container_id: str) -> None:
+        self._push_page(FilesPage(name, container_id))
+
+    def _on_image_activated(self, _: Gtk.Widget, image_id: str) -> None:
+        page = ImagePage(image_id)
+        page.connect("container-activated", self._on_container_name_activated)
+
+        self._push_page(page)
+
+    def _on_volume_activated(self, _: Gtk.Widget, name: str) -> None:
+        page = VolumePage(name)
+        page.connect("container-activated", self._on_container_name_activated)
+
+        self._push_page(page)
+
+    def _on_network_activated(self, _: Gtk.Widget, network_id: str) -> None:
+        page = NetworkPage(network_id)
+        page.connect("container-activated", self._on_container_name_activated)
+
+        self._push_page(page)
+
+    def _on_show_disk_usage(self, _: Gio.SimpleAction, __: GLib.Variant | None) -> None:
+        self._push_page(DiskUsagePage())
+
+    def _on_show_images(self, _: Gio.SimpleAction, __: GLib.Variant | None) -> None:
+        page = ImagesPage()
+        page.connect("image-activated", self._on_image_activated)
+
+        self._push_page(page)
+
+    def _on_show_volumes(self, _: Gio.SimpleAction, __: GLib.Variant | None) -> None:
+        page = VolumesPage()
+        page.connect("volume-activated", self._on_volume_activated)
+
+        self._push_page(page)
+
+    def _on_show_networks(self, _: Gio.SimpleAction, __: GLib.Variant | None) -> None:
+        page = NetworksPage()
+        page.connect("network-activated", self._on_network_activated)
 
-        details_page = ContainerPage(container)
-        self.nav_view.push(details_page)
+        self._push_page(page)